@@ -1,4 +1,5 @@
 # labellerr/__init__.py
 
-__version__ = "0.1.0"
+from ._defaults import get_default_client
 
+__version__ = "0.1.0"
@@ -0,0 +1,68 @@
+# labellerr/_defaults.py
+
+from collections import OrderedDict
+import os
+import threading
+from .exceptions import LabellerrError
+
+API_KEY_ENV='LABELLERR_API_KEY'
+API_SECRET_ENV='LABELLERR_API_SECRET'
+
+_ENV_LOADED=False
+
+## shared clients kept at once, one per credential pair; the least recently used is dropped first
+DEFAULT_CLIENTS_MAX=4
+_CLIENTS=OrderedDict()
+_CLIENTS_LOCK=threading.Lock()
+
+
+def load_env():
+    """
+    Loads a .env file into os.environ, once per process, when python-dotenv is
+    installed. Later calls return immediately without touching the disk.
+    """
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv()
+
+
+def get_default_client(api_key=None, api_secret=None):
+    """
+    Returns a shared LabellerrClient, creating it on first use.
+
+    Credentials default to the LABELLERR_API_KEY and LABELLERR_API_SECRET
+    environment variables (a .env file is read once if python-dotenv is installed). One client (and so one connection pool) is kept per
+    credential pair, so scripts that import each other reuse it. If a caller closes
+    the shared client, the next call creates a new one.
+
+    :param api_key: The API key for authentication.
+    :param api_secret: The API secret for authentication.
+    :return: A LabellerrClient.
+    :raises LabellerrError: If no credentials are given or set in the environment.
+    """
+    load_env()
+    api_key = api_key or os.environ.get(API_KEY_ENV)
+    api_secret = api_secret or os.environ.get(API_SECRET_ENV)
+    if not api_key or not api_secret:
+        raise LabellerrError(f"API credentials missing: pass them or set {API_KEY_ENV} and {API_SECRET_ENV}")
+    return _client_for(api_key, api_secret)
+
+
+def _client_for(api_key, api_secret):
+    # imported here so `import labellerr` stays cheap
+    from .client import LabellerrClient
+    key = (api_key, api_secret)
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(key)
+        if client is None or client.closed:
+            client = _CLIENTS[key] = LabellerrClient(api_key, api_secret)
+        _CLIENTS.move_to_end(key)
+        while len(_CLIENTS) > DEFAULT_CLIENTS_MAX:
+            _CLIENTS.popitem(last=False)
+        return client
@@ -0,0 +1,147 @@
+# labellerr/async_client.py
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from .client import LabellerrClient, _PollSchedule
+from .exceptions import LabellerrError
+
+ASYNC_MAX_WORKERS=16
+
+
+class AsyncLabellerrClient:
+    """
+    An asyncio front-end for the Labellerr API.
+
+    Every coroutine runs the matching LabellerrClient call on a worker thread,
+    so independent calls can be awaited together with asyncio.gather and share
+    the client's pooled keep-alive connections.
+    """
+    def __init__(self, api_key, api_secret, max_workers=ASYNC_MAX_WORKERS, http2=False):
+        """
+        Initializes the AsyncLabellerrClient with API credentials.
+
+        :param api_key: The API key for authentication.
+        :param api_secret: The API secret for authentication.
+        :param max_workers: The maximum number of calls in flight at once.
+        :param http2: Multiplex concurrent calls and uploads over HTTP/2 (requires the optional httpx[http2] package).
+        """
+        self.client = LabellerrClient(api_key, api_secret, http2=http2)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='labellerr-async')
+
+    async def _run(self, method, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(method, *args, **kwargs))
+
+    async def get_dataset(self, workspace_id, dataset_id, project_id, use_cache=True):
+        """
+        Retrieves a dataset from the Labellerr API.
+
+        :param workspace_id: The ID of the workspace.
+        :param dataset_id: The ID of the dataset.
+        :param project_id: The ID of the project.
+        :param use_cache: Set to False to skip cached copies and fetch from the API.
+        :return: The dataset as JSON.
+        """
+        return await self._run(self.client.get_dataset, workspace_id, dataset_id, project_id, use_cache=use_cache)
+
+    async def get_all_dataset(self, client_id, datatype, project_id, scope, use_cache=True):
+        """
+        Retrieves all datasets of a data type visible in the given scope.
+
+        :param client_id: The ID of the client.
+        :param datatype: The type of data for the dataset.
+        :param project_id: The ID of the project.
+        :param scope: The permission scope, one of SCOPE_LIST.
+        :param use_cache: Set to False to skip the cached listing and fetch from the API.
+        :return: The datasets as JSON.
+        """
+        return await self._run(self.client.get_all_dataset, client_id, datatype, project_id, scope, use_cache=use_cache)
+
+    async def get_all_project_per_client_id(self, client_id, use_cache=True):
+        """
+        Retrieves a list of projects associated with a client ID.
+
+        :param client_id: The ID of the client.
+        :param use_cache: Set to False to skip the cached list and fetch from the API.
+        :return: A dictionary containing the list of projects.
+        """
+        return await self._run(self.client.get_all_project_per_client_id, client_id, use_cache=use_cache)
+
+    async def link_dataset_to_project(self, client_id, project_id, dataset_id):
+        """
+        Links a dataset to a project.
+
+        :param client_id: The ID of the client.
+        :param project_id: The ID of the project.
+        :param dataset_id: The ID of the dataset.
+        :return: The response from the API.
+        """
+        return await self._run(self.client.link_dataset_to_project, client_id, project_id, dataset_id)
+
+    async def upload_folder_files_to_dataset(self, data_config):
+        """
+        Uploads local files from a folder to a dataset.
+
+        :param data_config: A dictionary containing the configuration for the data.
+        :return: A dictionary containing the track id and the successful and failed files.
+        """
+        return await self._run(self.client.upload_folder_files_to_dataset, data_config)
+
+    async def upload_files_to_dataset(self, data_config):
+        """
+        Uploads a list of local files to a dataset.
+
+        :param data_config: A dictionary containing the configuration for the data, with the paths in 'files_list'.
+        :return: A dictionary containing the track id and the successful and failed files.
+        """
+        return await self._run(self.client.upload_files_to_dataset, data_config)
+
+    async def upload_preannotation_by_project_id(self, project_id, client_id, annotation_format, annotation_file):
+        """
+        Uploads preannotation data to a project and waits for the job to complete.
+
+        Only the upload and each status check use a worker thread; the waits
+        between checks are asyncio sleeps, so many uploads can be awaited together
+        without holding a thread each while their jobs run.
+
+        :param project_id: The ID of the project.
+        :param client_id: The ID of the client.
+        :param annotation_format: The format of the preannotation data.
+        :param annotation_file: The file path of the preannotation data.
+        :return: The final job status.
+        :raises LabellerrError: If the upload fails.
+        """
+        try:
+            job_id = await self._run(
+                self.client._upload_preannotation_request, project_id, client_id, annotation_format, annotation_file
+            )
+            return await self._poll_until_complete(project_id, job_id, client_id)
+        except Exception as e:
+            raise LabellerrError(f"Failed to upload preannotation: {str(e)}")
+
+    async def _poll_until_complete(self, project_id, job_id, client_id):
+        # the same schedule as LabellerrClient._poll_until_complete, with asyncio sleeps
+        schedule = _PollSchedule(self.client.max_poll_wait)
+        while True:
+            status_data, max_age, retry_after = await self._run(self.client._fetch_job_status, project_id, job_id, client_id)
+            if status_data is not None:
+                return status_data
+
+            wait = schedule.next_wait(max_age, retry_after)
+            if wait is None:
+                raise schedule.timeout_error(job_id)
+            await asyncio.sleep(wait)
+
+    def close(self):
+        """
+        Shuts down the worker threads and the underlying HTTP session.
+        """
+        self._executor.shutdown(wait=True)
+        self.client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
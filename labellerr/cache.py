@@ -0,0 +1,166 @@
+# labellerr/cache.py
+
+from collections import OrderedDict
+from contextlib import closing
+import json
+import os
+import sqlite3
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see extras_require['fast']
+    orjson = None
+
+DISK_CACHE_TTL=3600
+MEMORY_CACHE_SIZE=256
+MEMORY_CACHE_TTL=300
+
+
+class MemoryCache:
+    """
+    A thread-safe, size-bounded LRU cache with per-entry expiry for the
+    lifetime of one client.
+    """
+    def __init__(self, maxsize=MEMORY_CACHE_SIZE, ttl=MEMORY_CACHE_TTL):
+        """
+        :param maxsize: The maximum number of entries kept before the least recently used is evicted.
+        :param ttl: The number of seconds an entry stays valid, or None to keep it until evicted.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Looks up a cached value.
+
+        :param key: A hashable key identifying the request.
+        :param default: The value returned on a miss.
+        :return: The cached value, or default if it is missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """
+        Stores a value, evicting the least recently used entry when full.
+
+        :param key: A hashable key identifying the request.
+        :param value: The value to cache.
+        """
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self, namespace=None):
+        """
+        Removes every cached value, or only those of one namespace.
+
+        :param namespace: If given, only tuple keys whose first item equals it are removed.
+        """
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if isinstance(key, tuple) and key[:1] == (namespace,)]:
+                del self._entries[key]
+
+
+class DiskCache:
+    """
+    A small SQLite-backed cache for API responses that survives between runs.
+
+    Values are stored as JSON (encoded with orjson when it is installed) together
+    with the response ETag, so an expired entry can still be revalidated with
+    If-None-Match instead of re-downloaded.
+    """
+    def __init__(self, path, ttl=DISK_CACHE_TTL, version=None):
+        """
+        Opens (and creates if needed) the cache database.
+
+        :param path: The path to the SQLite file.
+        :param ttl: The number of seconds an entry stays fresh.
+        :param version: The SDK version; entries written by a different version are dropped on open.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.ttl = ttl
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, etag TEXT, expires_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+            if version is not None:
+                row = conn.execute("SELECT value FROM meta WHERE name = 'version'").fetchone()
+                if row is None or row[0] != version:
+                    conn.execute("DELETE FROM responses")
+                    conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('version', ?)", (version,))
+
+    def _connect(self):
+        # one short-lived connection per operation keeps the cache usable from upload threads
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def _key(key):
+        return json.dumps(key, separators=(',', ':'))
+
+    def get(self, key):
+        """
+        Looks up a cached response.
+
+        :param key: A JSON-serialisable key identifying the request.
+        :return: A (value, etag, fresh) tuple, or None if the key is not cached.
+        """
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT value, etag, expires_at FROM responses WHERE key = ?", (self._key(key),)
+            ).fetchone()
+        if row is None:
+            return None
+        value, etag, expires_at = row
+        return (orjson.loads(value) if orjson else json.loads(value)), etag, expires_at > time.time()
+
+    def set(self, key, value, etag=None):
+        """
+        Stores a response.
+
+        :param key: A JSON-serialisable key identifying the request.
+        :param value: The JSON-serialisable response body.
+        :param etag: The ETag the server sent with the response, if any.
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, etag, expires_at) VALUES (?, ?, ?, ?)",
+                (self._key(key), orjson.dumps(value).decode() if orjson else json.dumps(value), etag, time.time() + self.ttl)
+            )
+
+    def clear(self, namespace=None):
+        """
+        Removes every cached response, or only those of one namespace.
+
+        :param namespace: If given, only list keys whose first item equals it are removed.
+        """
+        with closing(self._connect()) as conn, conn:
+            if namespace is None:
+                conn.execute("DELETE FROM responses")
+            else:
+                # keys are JSON arrays, so a namespace's keys share the prefix '["namespace",'
+                prefix = self._key([namespace])[:-1] + ','
+                conn.execute("DELETE FROM responses WHERE substr(key, 1, ?) = ?", (len(prefix), prefix))
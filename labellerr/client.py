@@ -2,78 +2,707 @@
 
 from concurrent import futures
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import uuid
+from urllib.parse import urlencode
+import itertools
+from contextlib import ExitStack
 from .exceptions import LabellerrError
-from unique_names_generator import get_random_name
-from unique_names_generator.data import ADJECTIVES, NAMES, ANIMALS
+from ._defaults import API_KEY_ENV, API_SECRET_ENV, load_env
+from .cache import DiskCache, MemoryCache
+from .http2 import Http2Session
+from .multipart import FILE_READ_BUFFER, LazyFile, MultipartStream
+from . import __version__
 import random
 import json
-import logging 
-from datetime import datetime 
+import logging
+from datetime import datetime, timezone
+import email.utils
 import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
-from multiprocessing import cpu_count
-import concurrent.futures
+import threading
+import weakref
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see extras_require['fast']
+    orjson = None
 
 FILE_BATCH_SIZE=15 * 1024 * 1024
 FILE_BATCH_COUNT=900
 TOTAL_FILES_SIZE_LIMIT_PER_DATASET=2.5*1024*1024*1024
 TOTAL_FILES_COUNT_LIMIT_PER_DATASET=2500
-ANNOTATION_FORMAT=['json', 'coco_json', 'csv', 'png']
+ANNOTATION_FORMAT=('json', 'coco_json', 'csv', 'png')
 
 ## DATA TYPES: image, video, audio, document, text
 DATA_TYPES=('image', 'video', 'audio', 'document', 'text')
+## lowercase tuples, so a lowercased file name is matched with a single str.endswith call
 DATA_TYPE_FILE_EXT = {
-    'image': ['.jpg','.jpeg', '.png', '.tiff'],
-    'video': ['.mp4'],
-    'audio': ['.mp3', '.wav'],
-    'document': ['.pdf'],
-    'text': ['.txt']
+    'image': ('.jpg','.jpeg', '.png', '.tiff'),
+    'video': ('.mp4',),
+    'audio': ('.mp3', '.wav'),
+    'document': ('.pdf',),
+    'text': ('.txt',)
 }
 
 SCOPE_LIST=['project','client','public']
 
+## how dataset uploads are split into requests: 'batched' packs files into
+## FILE_BATCH_SIZE multipart requests, 'per_file' sends one request per file
+UPLOAD_MODES=('batched', 'per_file')
+
+## payload keys initiate_create_project cannot do without
+CREATE_PROJECT_REQUIRED_PARAMS=('client_id', 'dataset_name', 'dataset_description', 'data_type', 'created_by', 'project_name', 'annotation_guide', 'autolabel')
+
+## default project rotation config, copied into payloads that omit one
+DEFAULT_ROTATION_CONFIG={
+    'annotation_rotation_count':1,
+    'review_rotation_count':1,
+    'client_review_rotation_count':1
+}
+
+## HTTP connection pool: one per host, kept alive across calls
+HTTP_POOL_CONNECTIONS=20
+HTTP_POOL_MAXSIZE=100
+## Retries: a few quick retries of idempotent calls on connection errors, rate limiting and gateway 5xx;
+## a Retry-After sent with 429/503 is waited out
+HTTP_RETRY_TOTAL=3
+HTTP_RETRY_BACKOFF_FACTOR=0.3
+HTTP_RETRY_STATUS_FORCELIST=(429, 502, 503, 504)
+HTTP_RETRY_METHODS=frozenset(['GET', 'HEAD', 'PUT'])
+## threads shared by a client's concurrent lookups (get_datasets, prefetching, job status checks)
+BULK_FETCH_MAX_WORKERS=16
+## default number of batches uploaded at once; uploads are network-bound, so this does not
+## depend on the CPU count. Per-client values may not exceed HTTP_POOL_MAXSIZE.
+UPLOAD_MAX_WORKERS=20
+## preannotation job polling: first wait, growth factor and longest wait between status checks (seconds)
+POLL_INITIAL_DELAY=0.5
+POLL_BACKOFF_BASE=1.5
+POLL_MAX_DELAY=30
+## up to this many seconds are added at random to each wait, so jobs started together do not poll in lockstep
+POLL_JITTER=0.25
+## default upper bound on the total time spent waiting for one preannotation job (seconds)
+POLL_MAX_WAIT=3600
+## preannotation job statuses that never change again; polling stops at any of them and
+## all but 'completed' are reported as a LabellerrError
+JOB_FINAL_STATUSES=('completed', 'failed', 'cancelled', 'error')
+## threads used to walk the top-level subfolders of an upload folder
+SCAN_MAX_WORKERS=32
+## background threads shared by the *_async methods of a client
+ASYNC_JOB_MAX_WORKERS=8
+
 # python -m unittest discover -s tests --run
 # python setup.py sdist bdist_wheel -- build
 create_dataset_parameters={}
 
+## DEBUG payload logs are cut to this many characters
+LOG_PAYLOAD_LIMIT=1024
+
+logger = logging.getLogger(__name__)
+
+## per-process prefix and counter for the cache-busting uuid query value of read-only calls
+_CACHE_BUSTER_PREFIX=uuid.uuid4().hex[:12]
+_cache_buster_counter=itertools.count()
+
+
+def _cache_buster():
+    """
+    Returns a value that is unique per request, for the uuid query parameter of
+    read-only calls, without drawing a fresh uuid4 from the OS each time.
+    """
+    return f"{_CACHE_BUSTER_PREFIX}-{next(_cache_buster_counter):x}"
+
+
+def _release(session, *executors):
+    """
+    Stops the background threads without waiting and closes the HTTP session of a client.
+    """
+    for executor in executors:
+        executor.shutdown(wait=False)
+    session.close()
+
+
+def _max_age(headers):
+    """
+    Returns how many seconds a response stays fresh according to its
+    Cache-Control max-age or Expires header, or 0 if neither is usable.
+    """
+    for directive in (headers.get('Cache-Control') or '').split(','):
+        name, _, value = directive.strip().partition('=')
+        if name.lower() == 'max-age':
+            try:
+                return max(0, int(value))
+            except ValueError:
+                return 0
+    expires = headers.get('Expires')
+    if expires:
+        try:
+            remaining = email.utils.parsedate_to_datetime(expires) - datetime.now(timezone.utc)
+        except (TypeError, ValueError):
+            return 0
+        return max(0, remaining.total_seconds())
+    return 0
+
+
+def _retry_after(headers):
+    """
+    Returns the number of seconds a Retry-After header (delta-seconds or an
+    HTTP date) asks the client to wait, or 0 if there is none or it is unusable.
+    """
+    value = headers.get('Retry-After')
+    if not value:
+        return 0
+    try:
+        return max(0, float(value))
+    except ValueError:
+        pass
+    try:
+        remaining = email.utils.parsedate_to_datetime(value) - datetime.now(timezone.utc)
+    except (TypeError, ValueError):
+        return 0
+    return max(0, remaining.total_seconds())
+
+
+class _PollSchedule:
+    """
+    The waits between the status checks of one preannotation poll loop, shared
+    by the sync, multi-job and asyncio loops so they back off the same way. The
+    wait starts at POLL_INITIAL_DELAY seconds and grows by POLL_BACKOFF_BASE up
+    to POLL_MAX_DELAY; a longer max-age from the server is waited out first, as
+    is a Retry-After of any length, a little random jitter keeps concurrent
+    pollers apart, and no wait runs past the deadline.
+    """
+    def __init__(self, max_wait):
+        """
+        :param max_wait: The number of seconds from now after which polling gives up.
+        """
+        self.max_wait = max_wait
+        self._delay = POLL_INITIAL_DELAY
+        self._deadline = time.monotonic() + max_wait
+
+    def next_wait(self, max_age, retry_after=0):
+        """
+        Returns how long to sleep before the next check, and advances the backoff.
+
+        :param max_age: The number of seconds the server says the status stays unchanged; at most POLL_MAX_DELAY is waited.
+        :param retry_after: The number of seconds a rate-limited server asked the client to wait; always waited in full.
+        :return: The wait in seconds, or None once the deadline has passed.
+        """
+        remaining = self._deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        # never sleep past the deadline; the last check happens right at it
+        wait = min(max(self._delay, min(max_age, POLL_MAX_DELAY), retry_after) + random.uniform(0, POLL_JITTER), remaining)
+        self._delay = min(self._delay * POLL_BACKOFF_BASE, POLL_MAX_DELAY)
+        return wait
+
+    def timeout_error(self, job_id):
+        """
+        :param job_id: The ID of the preannotation job that did not complete.
+        :return: The LabellerrError reporting that the deadline passed.
+        """
+        return LabellerrError(f"Preannotation job {job_id} did not complete within {self.max_wait} s")
+
+
+def _job_outcome(job_id, status_data):
+    """
+    Returns the status of a finished preannotation job, or raises if it did not complete.
+
+    :param job_id: The ID of the preannotation job.
+    :param status_data: The job status as returned by the API, in a final state.
+    :return: status_data, if the job completed.
+    :raises LabellerrError: If the job failed, was cancelled or ended in error.
+    """
+    job = status_data['response']
+    if job.get('status') != 'completed':
+        reason = job.get('message') or job.get('error')
+        raise LabellerrError(f"Preannotation job {job_id} {job.get('status')}" + (f": {reason}" if reason else ""))
+    return status_data
+
+
+def _log_payload(message, payload):
+    """
+    Logs a request or response payload at DEBUG level, truncated. The payload
+    is only converted to text when DEBUG logging is enabled.
+
+    :param message: A short description of the payload.
+    :param payload: The payload (string, bytes or object).
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        if isinstance(payload, bytes):
+            text = payload.decode('utf-8', 'replace')
+        else:
+            text = payload if isinstance(payload, str) else repr(payload)
+        logger.debug("%s: %s", message, text[:LOG_PAYLOAD_LIMIT])
+
+
+def _log_response(message, response):
+    """
+    Logs the status, decoded size and transfer encoding of a response at DEBUG
+    level, e.g. to check that large listings arrive compressed.
+
+    :param message: A short description of the call.
+    :param response: The HTTP response.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s: HTTP %s, %d bytes, content-encoding %s", message, response.status_code,
+                     len(response.content), response.headers.get('Content-Encoding', 'identity'))
+
+
+def _json_dumps(obj):
+    """
+    Encodes a request body as JSON, using orjson when it is installed.
+
+    :param obj: The JSON-serialisable object.
+    :return: The encoded body, as bytes with orjson or str without.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj)
+
+
+def _json_loads(content):
+    """
+    Decodes a JSON response body, using orjson when it is installed.
+
+    :param content: The raw response bytes.
+    :return: The decoded JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _scan_directory(directory, extensions):
+    """
+    Lists one directory with os.scandir. Names are filtered before any stat,
+    and each matching file is stat'ed once.
+
+    :param directory: The directory to list.
+    :param extensions: A tuple of accepted lowercase file name suffixes; names are matched case-insensitively.
+    :return: A ((path, size) list, subdirectory path list) tuple.
+    """
+    files = []
+    subdirectories = []
+    try:
+        entries = os.scandir(directory)
+    except OSError as e:
+        logger.warning("Error reading %s: %s", directory, e)
+        return files, subdirectories
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(entry.path)
+                elif entry.name.lower().endswith(extensions) and entry.is_file():
+                    files.append((entry.path, entry.stat().st_size))
+            except OSError as e:
+                logger.warning("Error reading %s: %s", entry.path, e)
+    return files, subdirectories
+
+
+class _ScanBudget:
+    """
+    Running totals shared by the threads of one folder scan, so the scan stops
+    as soon as a dataset limit is crossed instead of walking the whole tree.
+    """
+    def __init__(self, count_limit=None, size_limit=None):
+        """
+        :param count_limit: The maximum number of files, or None for no limit.
+        :param size_limit: The maximum total size in bytes, or None for no limit.
+        """
+        self.count_limit = count_limit
+        self.size_limit = size_limit
+        self.count = 0
+        self.size = 0
+        self._lock = threading.Lock()
+
+    def add(self, files):
+        """
+        Adds the files found in one directory to the totals.
+
+        :param files: A list of (path, size) tuples.
+        :raises LabellerrError: If a limit has been crossed.
+        """
+        with self._lock:
+            self.count += len(files)
+            self.size += sum(size for _, size in files)
+            count, size = self.count, self.size
+        if self.count_limit is not None and count > self.count_limit:
+            raise LabellerrError(f"Total file count: more than {self.count_limit} files found, which is too many file to upload")
+        if self.size_limit is not None and size > self.size_limit:
+            raise LabellerrError(f"Total file size: more than {self.size_limit/1024/1024:.1f}MB found, which is too large to upload")
+
+
+def _scan_tree(folder_path, extensions, budget=None):
+    """
+    Walks a folder tree on the calling thread.
+
+    :param folder_path: The root folder.
+    :param extensions: A tuple of accepted lowercase file name suffixes; names are matched case-insensitively.
+    :param budget: An optional _ScanBudget checked after every directory.
+    :return: A list of (path, size) tuples.
+    """
+    files = []
+    stack = [folder_path]
+    while stack:
+        found, subdirectories = _scan_directory(stack.pop(), extensions)
+        if budget is not None:
+            budget.add(found)
+        files.extend(found)
+        stack.extend(subdirectories)
+    return files
+
+
+def _scan_folder(folder_path, extensions, count_limit=None, size_limit=None):
+    """
+    Finds every file in a folder tree whose name ends with one of the
+    extensions. The top-level subfolders are walked on separate threads,
+    since stat latency dominates on network and FUSE filesystems.
+
+    :param folder_path: The root folder.
+    :param extensions: A tuple of accepted lowercase file name suffixes; names are matched case-insensitively.
+    :param count_limit: Stop with an error once more files than this are found.
+    :param size_limit: Stop with an error once the files found exceed this many bytes.
+    :return: A list of (path, size) tuples.
+    :raises LabellerrError: If a limit is crossed.
+    """
+    budget = _ScanBudget(count_limit, size_limit) if count_limit is not None or size_limit is not None else None
+    files, subdirectories = _scan_directory(folder_path, extensions)
+    if budget is not None:
+        budget.add(files)
+    if len(subdirectories) < 2:
+        for subdirectory in subdirectories:
+            files.extend(_scan_tree(subdirectory, extensions, budget))
+        return files
+    with ThreadPoolExecutor(max_workers=min(SCAN_MAX_WORKERS, len(subdirectories))) as executor:
+        for found in executor.map(lambda subdirectory: _scan_tree(subdirectory, extensions, budget), subdirectories):
+            files.extend(found)
+    return files
+
+
+def _file_size(file_path):
+    """
+    Returns the size of file_path in bytes, or None if it cannot be stat'ed.
+    """
+    try:
+        return os.stat(file_path).st_size
+    except OSError as e:
+        logger.warning("Error reading %s: %s", file_path, e)
+        return None
+
+
+def _stat_files(files_list, extensions):
+    """
+    Finds the size of every path in the list whose name ends with one of the
+    extensions, skipping missing or unreadable files. The stat calls run on
+    a thread pool, since their latency dominates on network filesystems.
+
+    :param files_list: The list of file paths.
+    :param extensions: A tuple of accepted lowercase file name suffixes; names are matched case-insensitively.
+    :return: A list of (path, size) tuples, in list order.
+    """
+    paths = [file_path for file_path in files_list if file_path is not None and file_path.lower().endswith(extensions)]
+    if len(paths) < 2:
+        sizes = [_file_size(file_path) for file_path in paths]
+    else:
+        with ThreadPoolExecutor(max_workers=min(SCAN_MAX_WORKERS, len(paths))) as executor:
+            sizes = list(executor.map(_file_size, paths))
+    return [(file_path, size) for file_path, size in zip(paths, sizes) if size is not None]
+
+
+def _pack_batches(files, max_size=FILE_BATCH_SIZE, max_count=FILE_BATCH_COUNT):
+    """
+    Groups files into upload batches with first-fit decreasing: largest files
+    first, each into the first batch with room for it, so batches end up close
+    to max_size and fewer requests are needed. A file larger than max_size
+    gets a batch of its own.
+
+    :param files: A list of (path, size) tuples.
+    :param max_size: The maximum total size of a batch in bytes.
+    :param max_count: The maximum number of files in a batch.
+    :return: A list of batches, each a list of file paths.
+    """
+    batches = []
+    for path, size in sorted(files, key=lambda file: file[1], reverse=True):
+        for batch in batches:
+            if batch[0] + size <= max_size and len(batch[1]) < max_count:
+                batch[0] += size
+                batch[1].append(path)
+                break
+        else:
+            batches.append([size, [path]])
+    return [paths for _, paths in batches]
+
+
 class LabellerrClient:
     """
     A client for interacting with the Labellerr API.
     """
-    def __init__(self, api_key, api_secret):
+    def __init__(self, api_key, api_secret, cache_dir=None, http2=False, max_upload_concurrency=UPLOAD_MAX_WORKERS,
+                 max_poll_wait=POLL_MAX_WAIT):
         """
         Initializes the LabellerrClient with API credentials.
 
         :param api_key: The API key for authentication.
         :param api_secret: The API secret for authentication.
+        :param cache_dir: Optional directory for an on-disk cache of read-only lookups, reused across runs.
+        :param http2: Multiplex concurrent calls over HTTP/2 (requires the optional httpx[http2] package).
+        :param max_upload_concurrency: The maximum number of file batches uploaded at once.
+        :param max_poll_wait: The longest time, in seconds, to wait for a preannotation job before giving up.
+        :raises LabellerrError: If max_upload_concurrency is not between 1 and HTTP_POOL_MAXSIZE.
         """
+        if not isinstance(max_upload_concurrency, int) or not 1 <= max_upload_concurrency <= HTTP_POOL_MAXSIZE:
+            raise LabellerrError(f"max_upload_concurrency must be an integer between 1 and {HTTP_POOL_MAXSIZE}")
         self.api_key = api_key
         self.api_secret = api_secret
+        self.max_upload_concurrency = max_upload_concurrency
+        self.max_poll_wait = max_poll_wait
         self.base_url = "https://api-gateway-qcb3iv2gaa-uc.a.run.app" #--dev
         # self.base_url = "https://api.labellerr.com" #--prod
 
-    def get_dataset(self, workspace_id, dataset_id, project_id):
+        if http2:
+            self._session = Http2Session(
+                max_connections=HTTP_POOL_MAXSIZE,
+                max_keepalive_connections=HTTP_POOL_CONNECTIONS,
+                retries=HTTP_RETRY_TOTAL
+            )
+        else:
+            # reuse TCP/TLS connections across calls (and upload threads); requests already
+            # sends Accept-Encoding gzip/deflate, plus br when brotli is installed (see
+            # extras_require['fast']), and decodes compressed responses transparently
+            self._session = requests.Session()
+            retry = Retry(
+                total=HTTP_RETRY_TOTAL,
+                connect=HTTP_RETRY_TOTAL,
+                read=2,
+                backoff_factor=HTTP_RETRY_BACKOFF_FACTOR,
+                status_forcelist=HTTP_RETRY_STATUS_FORCELIST,
+                allowed_methods=HTTP_RETRY_METHODS,
+                respect_retry_after_header=True,
+                # hand the last response back so callers report the real status and body
+                raise_on_status=False
+            )
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retry)
+            self._session.mount('http://', adapter)
+            self._session.mount('https://', adapter)
+            self._session.headers.update({'Connection': 'keep-alive'})
+
+        # credentials and the usual JSON/origin headers are the same on almost every call, so
+        # they are set once on the session; calls add client_id and override the rest as needed
+        self._session.headers.update({
+            'api_key': self.api_key,
+            'api_secret': self.api_secret,
+            'source': 'sdk',
+            'content-type': 'application/json',
+            'origin': 'https://dev.labellerr.com'
+        })
+
+        # one pool runs every *_async call in the background for the lifetime of the client
+        self._executor = ThreadPoolExecutor(max_workers=ASYNC_JOB_MAX_WORKERS, thread_name_prefix='labellerr')
+        # short lookups fanned out over the keep-alive pool share another; threads start on first use
+        self._io_pool = ThreadPoolExecutor(max_workers=BULK_FETCH_MAX_WORKERS, thread_name_prefix='labellerr-io')
+
+        # close pooled sockets when the client is garbage collected or at interpreter exit
+        self._finalizer = weakref.finalize(self, _release, self._session, self._executor, self._io_pool)
+
+        self._memory_cache = MemoryCache()
+        # a completed job's status never changes, so it is kept without expiry
+        self._job_status_cache = MemoryCache(ttl=None)
+        # (ETag, status) of the last reply for each job still running
+        self._job_status_etags = {}
+        # identical reads issued concurrently share one in-flight request
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        # entries written by another SDK version are dropped when the cache is opened
+        self._disk_cache = DiskCache(os.path.join(cache_dir, 'cache.sqlite'), version=__version__) if cache_dir else None
+
+    @classmethod
+    def from_env(cls, **kwargs):
+        """
+        Creates a client from the LABELLERR_API_KEY and LABELLERR_API_SECRET environment variables,
+        reading a .env file once per process if python-dotenv is installed.
+
+        :param kwargs: Extra keyword arguments passed to the constructor.
+        :return: A LabellerrClient.
+        :raises LabellerrError: If either variable is not set.
+        """
+        load_env()
+        api_key = os.environ.get(API_KEY_ENV)
+        api_secret = os.environ.get(API_SECRET_ENV)
+        if not api_key or not api_secret:
+            raise LabellerrError(f"API credentials missing: set {API_KEY_ENV} and {API_SECRET_ENV}")
+        return cls(api_key, api_secret, **kwargs)
+
+    def close(self):
+        """
+        Waits for pending *_async calls, then closes the worker threads and the
+        pooled HTTP connections. The client must not be used afterwards.
+        """
+        self._executor.shutdown(wait=True)
+        self._io_pool.shutdown(wait=True)
+        self._finalizer()
+
+    @property
+    def closed(self):
+        """
+        True once close() has been called and the client can no longer be used.
+        """
+        return not self._finalizer.alive
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def clear_cache(self):
+        """
+        Drops every cached lookup so the next call is fetched from the API.
+        """
+        self.invalidate_cache()
+
+    def invalidate_cache(self, method_name=None):
+        """
+        Drops cached lookups, in memory and on disk.
+
+        :param method_name: The read method whose results are dropped, e.g. 'get_all_dataset'; None drops everything.
+        """
+        self._memory_cache.clear(method_name)
+        if self._disk_cache is not None:
+            self._disk_cache.clear(method_name)
+
+    def _invalidate_datasets(self):
+        """
+        Drops cached datasets and dataset listings after a dataset write.
+        """
+        self.invalidate_cache('get_dataset')
+        self.invalidate_cache('get_all_dataset')
+
+    def _single_flight(self, key, fetch):
+        """
+        Runs fetch() once for all concurrent callers asking for the same key;
+        the others wait for and share its result.
+
+        :param key: A hashable key identifying the request.
+        :param fetch: A callable performing the request.
+        :return: The result of fetch().
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = futures.Future()
+                self._inflight[key] = future
+        if not leader:
+            return future.result()
+
+        try:
+            result = fetch()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def get_dataset(self, workspace_id, dataset_id, project_id, use_cache=True):
         """
         Retrieves a dataset from the Labellerr API.
 
         :param workspace_id: The ID of the workspace.
         :param dataset_id: The ID of the dataset.
         :param project_id: The ID of the project.
+        :param use_cache: Set to False to skip cached copies and fetch from the API.
         :return: The dataset as JSON.
         """
-        url = f"{self.base_url}?client_id={workspace_id}&dataset_id={dataset_id}&project_id={project_id}&uuid={str(uuid.uuid4())}"
+        cache_key = ('get_dataset', workspace_id, dataset_id, project_id)
+        url = f"{self.base_url}?" + urlencode({
+            'client_id': workspace_id, 'dataset_id': dataset_id, 'project_id': project_id, 'uuid': _cache_buster()
+        })
         headers = {
-            'api_key': self.api_key,
-            'api_secret': self.api_secret,
-            'source':'sdk',
             'Origin': 'https://pro.labellerr.com'
         }
-        response = requests.get(url, headers=headers)
+        return self._read_cached(cache_key, use_cache, lambda: self._fetch_body(cache_key, url, headers, use_cache, "Error"))
+
+    def _read_cached(self, cache_key, use_cache, fetch):
+        """
+        Serves a read-only lookup from the in-memory cache, or runs fetch once for
+        all concurrent callers. The cache keeps the encoded body and every caller
+        decodes its own copy, so changing a result never alters what later calls see.
+
+        :param cache_key: The key the response is cached under; its first item names the method.
+        :param use_cache: Set to False to skip the cached copy and any request already in flight, and fetch anew.
+        :param fetch: A callable returning the encoded JSON body.
+        :return: The response as JSON.
+        """
+        if not use_cache:
+            # a fetch already in flight may have started before the change the caller wants to see
+            return _json_loads(fetch())
+        content = self._memory_cache.get(cache_key)
+        if content is not None:
+            return _json_loads(content)
+        return _json_loads(self._single_flight(cache_key, fetch))
+
+    def _fetch_body(self, cache_key, url, headers, use_cache=True, error_prefix="Error"):
+        """
+        Helper method that GETs a read-only JSON resource through the caches. A fresh
+        on-disk copy is returned without a request, and a stale one is revalidated
+        with its ETag.
+
+        :param cache_key: The key the response is cached under; its first item names the method.
+        :param url: The URL to fetch.
+        :param headers: The per-call request headers.
+        :param use_cache: Set to False to ignore the on-disk copy.
+        :param error_prefix: The start of the error message raised for a failed request.
+        :return: The encoded JSON body, as also kept in the in-memory cache.
+        :raises LabellerrError: If the API answers with an error status.
+        """
+        headers = dict(headers)
+        cached = self._disk_cache.get(cache_key) if use_cache and self._disk_cache is not None else None
+        if cached is not None:
+            value, etag, fresh = cached
+            if fresh:
+                content = _json_dumps(value)
+                self._memory_cache.set(cache_key, content)
+                return content
+            if etag:
+                headers['If-None-Match'] = etag
+
+        response = self._session.request("GET", url, headers=headers)
+        _log_response(cache_key[0], response)
+        if response.status_code == 304 and cached is not None:
+            self._disk_cache.set(cache_key, value, etag=etag)
+            content = _json_dumps(value)
+            self._memory_cache.set(cache_key, content)
+            return content
         if response.status_code != 200:
-            raise LabellerrError(f"Error {response.status_code}: {response.text}")
-        return response.json()
+            raise LabellerrError(f"{error_prefix}: {response.status_code} - {response.text}")
+        content = response.content
+        if self._disk_cache is not None:
+            self._disk_cache.set(cache_key, _json_loads(content), etag=response.headers.get('ETag'))
+        self._memory_cache.set(cache_key, content)
+        return content
+
+    def get_datasets(self, workspace_id, dataset_ids, project_id):
+        """
+        Retrieves several datasets at once, issuing the lookups concurrently.
+
+        :param workspace_id: The ID of the workspace.
+        :param dataset_ids: The IDs of the datasets; duplicates are fetched once.
+        :param project_id: The ID of the project.
+        :return: A dictionary mapping each dataset ID to its dataset JSON.
+        """
+        dataset_ids = list(dict.fromkeys(dataset_ids))
+        if not dataset_ids:
+            return {}
+
+        datasets = self._io_pool.map(lambda dataset_id: self.get_dataset(workspace_id, dataset_id, project_id), dataset_ids)
+        return dict(zip(dataset_ids, datasets))
 
     
 
@@ -87,76 +716,66 @@ class LabellerrClient:
         :param rotation_config: The rotation configuration for the project.
         :return: A dictionary containing the project ID, response status, and project configuration.
         """
+        # the name word lists are large; load them only when a project is created
+        from unique_names_generator import get_random_name
+        from unique_names_generator.data import ADJECTIVES, NAMES, ANIMALS
+
         try:
             unique_id = str(uuid.uuid4())
-            url = f"{self.base_url}/projects/create?stage=1&client_id={client_id}&uuid={unique_id}"
+            url = f"{self.base_url}/projects/create?" + urlencode({'stage': 1, 'client_id': client_id, 'uuid': unique_id})
 
             project_id = get_random_name(combo=[NAMES, ADJECTIVES, ANIMALS], separator="_", style="lowercase") + '_' + str(random.randint(10000, 99999))
 
-            payload = json.dumps({
+            payload = _json_dumps({
                 "project_id": project_id,
                 "project_name": project_name,
                 "data_type": data_type
             })
 
-            print(f"Create Empty Project Payload: {payload}")
+            _log_payload("Create Empty Project Payload", payload)
 
-            headers = {
-                'client_id': str(client_id),
-                'content-type': 'application/json',
-                'api_key':self.api_key,
-                'api_secret': self.api_secret,
-                'source':'sdk',
-                'origin': 'https://dev.labellerr.com'
-            }
+            headers = {'client_id': str(client_id)}
 
-            response = requests.request("POST", url, headers=headers, data=payload)
+            response = self._session.request("POST", url, headers=headers, data=payload)
 
             if response.status_code != 200:
                 raise LabellerrError(f"Project creation failed: {response.status_code} - {response.text}")
-            print("rotation_config - - > ",rotation_config)
+            # cached project lists do not include the new project yet
+            self.invalidate_cache('get_all_project_per_client_id')
+            _log_payload("rotation_config", rotation_config)
             if rotation_config is None:
-                rotation_config = {
-                    'annotation_rotation_count':1,
-                    'review_rotation_count':1,
-                    'client_review_rotation_count':1
-                }
+                rotation_config = dict(DEFAULT_ROTATION_CONFIG)
 
-            self.rotation_config=rotation_config
-            self.project_id=project_id
-            self.client_id=client_id
-                
-            rotation_request_response=self.update_rotation_count()
+            # passed along rather than kept on the client, which other threads may be using
+            rotation_request_response=self.update_rotation_count(project_id, client_id, rotation_config)
 
             return {'project_id': project_id, 'response': 'success','project_config':rotation_request_response}
         except LabellerrError as e:
-            logging.error(f"Failed to create project: {e}")
+            logger.error("Failed to create project: %s", e)
             raise
 
-    def update_rotation_count(self):
+    def update_rotation_count(self, project_id, client_id, rotation_config):
 
         """
         Updates the rotation count for a project.
 
+        :param project_id: The ID of the project.
+        :param client_id: The ID of the client.
+        :param rotation_config: A dictionary containing the configuration for the rotations.
         :return: A dictionary indicating the success of the operation.
         """
         try:
             unique_id = str(uuid.uuid4())
-            url = f"{self.base_url}/projects/rotations/add?project_id={self.project_id}&client_id={self.client_id}&uuid={unique_id}"
-
-            headers = {
-                'client_id': self.client_id,
-                'content-type': 'application/json',
-                'api_key': self.api_key,
-                'api_secret': self.api_secret,
+            url = f"{self.base_url}/projects/rotations/add?" + urlencode({
+                'project_id': project_id, 'client_id': client_id, 'uuid': unique_id
+            })
 
-                'origin': 'https://dev.labellerr.com'
-                }
+            headers = {'client_id': str(client_id)}
 
-            payload = json.dumps(self.rotation_config)
-            print(f"Update Rotation Count Payload: {payload}")
+            payload = _json_dumps(rotation_config)
+            _log_payload("Update Rotation Count Payload", payload)
 
-            response = requests.request("POST", url, headers=headers, data=payload)
+            response = self._session.request("POST", url, headers=headers, data=payload)
 
 
 
@@ -165,7 +784,7 @@ class LabellerrClient:
 
             return {'msg': 'project rotation configuration updated'}
         except LabellerrError as e:
-            logging.error(f"Project rotation update config failed: {e}")
+            logger.error("Project rotation update config failed: %s", e)
             raise
 
     def create_dataset(self,dataset_config):
@@ -183,17 +802,10 @@ class LabellerrClient:
             dataset_id=f"dataset-{dataset_config['data_type']}-{uuid.uuid4().hex[:8]}"
 
             unique_id = str(uuid.uuid4())
-            url = f"{self.base_url}/datasets/create?client_id={dataset_config['client_id']}&uuid={unique_id}"
-            headers = {
-                'client_id': str(dataset_config['client_id']),
-                'content-type': 'application/json',
-                'api_key': self.api_key,
-                'api_secret': self.api_secret,
-                'source':'sdk',
-                'origin': 'https://dev.labellerr.com'
-                }
+            url = f"{self.base_url}/datasets/create?" + urlencode({'client_id': dataset_config['client_id'], 'uuid': unique_id})
+            headers = {'client_id': str(dataset_config['client_id'])}
            
-            payload = json.dumps(
+            payload = _json_dumps(
                 {
                     "dataset_id": dataset_id,
                     "dataset_name": dataset_config['dataset_name'],
@@ -208,30 +820,33 @@ class LabellerrClient:
                     "files_count": 0,
                     "access": "write",
                     "created_at": datetime.now().isoformat(),
-                    "id": f"dataset-{dataset_config['data_type']}-{uuid.uuid4().hex[:8]}",
+                    "id": dataset_id,
                     "name": dataset_config['dataset_name'],
                     "description": dataset_config['dataset_description']
                 }
             )
 
-            response = requests.request("POST", url, headers=headers, data=payload)
+            response = self._session.request("POST", url, headers=headers, data=payload)
             
             if response.status_code != 200:
                 raise LabellerrError(f"dataset creation failed: {response.status_code} - {response.text}, request track id, {unique_id}")
+            # cached listings do not include the new dataset yet
+            self._invalidate_datasets()
 
             return {'response': 'success','dataset_id':dataset_id,'track_id':unique_id}
 
         except LabellerrError as e:
-            e['track_id']=unique_id
-            logging.error(f"Failed to create dataset: {e}")
+            # the track id, when there is one, is already in the message
+            logger.error("Failed to create dataset: %s", e)
             raise
 
-    def get_all_dataset(self,client_id,datatype,project_id,scope):
+    def get_all_dataset(self,client_id,datatype,project_id,scope,use_cache=True):
         """
         Retrieves a dataset by its ID.
 
         :param client_id: The ID of the client.
         :param datatype: The type of data for the dataset.
+        :param use_cache: Set to False to skip the cached listing and fetch from the API.
         :return: The dataset as JSON.
         """
         # validate parameters
@@ -247,55 +862,81 @@ class LabellerrClient:
         if scope not in SCOPE_LIST:
             raise LabellerrError(f"scope must be one of {', '.join(SCOPE_LIST)}")
 
+        cache_key = ('get_all_dataset', client_id, datatype, project_id, scope)
+
         # get dataset
-        try:
-            unique_id = str(uuid.uuid4())
-            url = f"{self.base_url}/datasets/list?client_id={client_id}&data_type={datatype}&permission_level={scope}&project_id={project_id}&uuid={unique_id}"
-            headers = {
-                'client_id': client_id,
-                'content-type': 'application/json',
-                'api_key': self.api_key,
-                'api_secret': self.api_secret,
-                'source':'sdk',
-                'origin': 'https://dev.labellerr.com'
-                }
+        def fetch():
+            try:
+                url = f"{self.base_url}/datasets/list?" + urlencode({
+                    'client_id': client_id, 'data_type': datatype, 'permission_level': scope,
+                    'project_id': project_id, 'uuid': _cache_buster()
+                })
+                headers = {'client_id': client_id}
+                return self._fetch_body(cache_key, url, headers, use_cache, "dataset retrieval failed")
+            except LabellerrError as e:
+                logger.error("Failed to retrieve dataset: %s", e)
+                raise
 
-            response = requests.request("GET", url, headers=headers)
+        return self._read_cached(cache_key, use_cache, fetch)
 
-            if response.status_code != 200:
-                raise LabellerrError(f"dataset retrieval failed: {response.status_code} - {response.text}")
-            return response.json()
-        except LabellerrError as e:
-            logging.error(f"Failed to retrieve dataset: {e}")
-            raise
+    def prefetch_project_datasets(self, client_id, projects, scope='project'):
+        """
+        Starts fetching the dataset listing of each project in the background, so
+        later get_all_dataset calls for them are served from the cache or join the
+        request already in flight.
+
+        :param client_id: The ID of the client.
+        :param projects: Project dictionaries as returned by get_all_project_per_client_id, with 'project_id' and 'data_type'.
+        :param scope: The permission scope to list, one of SCOPE_LIST.
+        :return: A list of futures, one per project, resolving to its datasets.
+        """
+        projects = [p for p in projects if p.get('project_id') and p.get('data_type')]
+        if not projects:
+            return []
+
+        return [
+            self._io_pool.submit(self.get_all_dataset, client_id, project['data_type'], project['project_id'], scope)
+            for project in projects
+        ]
 
-    def get_total_folder_file_count_and_total_size(self,folder_path,data_type):
+    def iter_all_dataset(self,client_id,datatype,project_id,scopes=None):
+        """
+        Yields the datasets of several scopes, fetching the next scope in the
+        background while the current one is being consumed.
+
+        :param client_id: The ID of the client.
+        :param datatype: The type of data for the dataset.
+        :param project_id: The ID of the project.
+        :param scopes: The scopes to list, defaults to every scope in SCOPE_LIST.
+        :return: A generator of (scope, dataset) pairs.
+        """
+        scopes = list(SCOPE_LIST if scopes is None else scopes)
+        if not scopes:
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self.get_all_dataset, client_id, datatype, project_id, scopes[0])
+            for index, scope in enumerate(scopes):
+                result = future.result()
+                if index + 1 < len(scopes):
+                    future = executor.submit(self.get_all_dataset, client_id, datatype, project_id, scopes[index + 1])
+                for key in ('linked', 'unlinked'):
+                    for dataset in result.get(key, []):
+                        yield scope, dataset
+
+    def get_total_folder_file_count_and_total_size(self,folder_path,data_type,count_limit=None,size_limit=None):
         """
         Retrieves the total count and size of files in a folder.
 
         :param folder_path: The path to the folder.
         :param data_type: The type of data for the files.
+        :param count_limit: Optional maximum file count; the scan stops with an error as soon as it is exceeded.
+        :param size_limit: Optional maximum total size in bytes; the scan stops with an error as soon as it is exceeded.
         :return: The total count and size of the files.
+        :raises LabellerrError: If a limit is exceeded.
         """
-        total_file_count=0
-        total_file_size=0
-        files_list=[]
-        for root, dirs, files in os.walk(folder_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                # print('>>  ',file_path)
-                try:
-                    # check if the file extention matching based on datatype
-                    if not any(file.endswith(ext) for ext in DATA_TYPE_FILE_EXT[data_type]):
-                        continue
-                    files_list.append(file_path)
-                    file_size = os.path.getsize(file_path)
-                    total_file_count += 1
-                    total_file_size += file_size
-                except Exception as e:
-                    print(f"Error reading {file_path}: {str(e)}")
-
-        return total_file_count, total_file_size, files_list
+        files = _scan_folder(folder_path, DATA_TYPE_FILE_EXT[data_type], count_limit, size_limit)
+        return len(files), sum(size for _, size in files), [path for path, _ in files]
     
 
     def get_total_file_count_and_total_size(self,files_list,data_type):
@@ -306,144 +947,176 @@ class LabellerrClient:
         :param data_type: The type of data for the files.
         :return: The total count and size of the files.
         """
-        total_file_count=0
-        total_file_size=0
-        # for root, dirs, files in os.walk(folder_path):
-        for file_path in files_list:
-            if file_path is None:
-                continue
-            try:
-                # check if the file extention matching based on datatype
-                if not any(file_path.endswith(ext) for ext in DATA_TYPE_FILE_EXT[data_type]):
-                    continue
-                file_size = os.path.getsize(file_path)
-                total_file_count += 1
-                total_file_size += file_size
-            except OSError as e:
-                print(f"Error reading {file_path}: {str(e)}")
-            except Exception as e:
-                print(f"Unexpected error reading {file_path}: {str(e)}")
-
-        return total_file_count, total_file_size, files_list
+        files = _stat_files(files_list, DATA_TYPE_FILE_EXT[data_type])
+        return len(files), sum(size for _, size in files), [path for path, _ in files]
 
 
     def upload_folder_files_to_dataset(self, data_config):
         """
         Uploads local files from a folder to a dataset using parallel processing.
 
-        :param data_config: A dictionary containing the configuration for the data.
+        :param data_config: A dictionary containing the configuration for the data, optionally with an 'upload_mode' from UPLOAD_MODES.
         :return: A dictionary containing the response status and the list of successfully uploaded files.
         """
         try:
-            unique_id = str(uuid.uuid4())
-            url = f"{self.base_url}/connectors/upload/local?data_type={data_config['data_type']}&dataset_id={data_config['dataset_id']}&project_id=null&project_independent=false&client_id={data_config['client_id']}&uuid={unique_id}"
-            data_config['url'] = url
-            
-            success_queue = []
-            fail_queue = []
+            return self._upload_to_dataset(data_config, self._collect_upload_files(data_config))
 
-            # Get files from folder
-            total_file_count, total_file_volumn, filenames = self.get_total_folder_file_count_and_total_size(
-                data_config['folder_path'], 
-                data_config['data_type']
-            )
-            
-            # Check file limits
-            if total_file_count > TOTAL_FILES_COUNT_LIMIT_PER_DATASET:
-                raise LabellerrError(f"Total file count: {total_file_count} where limit is {TOTAL_FILES_COUNT_LIMIT_PER_DATASET} is too many file to upload")
-            if total_file_volumn > TOTAL_FILES_SIZE_LIMIT_PER_DATASET:
-                raise LabellerrError(f"Total file size: {total_file_volumn/1024/1024:.1f}MB where the limit is {TOTAL_FILES_SIZE_LIMIT_PER_DATASET/1024/1024:.1f}MB is too large to upload")
-
-            print(f"Total file count: {total_file_count}")
-            print(f"Total file size: {total_file_volumn/1024/1024:.1f} MB")
+        except Exception as e:
+            raise LabellerrError(f"Failed to upload files: {str(e)}")
 
-            # Group files into batches based on FILE_BATCH_SIZE
-            batches = []
-            current_batch = []
-            current_batch_size = 0
+    def upload_files_to_dataset(self, data_config):
+        """
+        Uploads a list of local files to a dataset using parallel processing.
 
-            for file_path in filenames:
-                try:
-                    file_size = os.path.getsize(file_path)
-                    if current_batch_size + file_size > FILE_BATCH_SIZE or len(current_batch) >= FILE_BATCH_COUNT:
-                        if current_batch:
-                            batches.append(current_batch)
-                        current_batch = [file_path]
-                        current_batch_size = file_size
-                    else:
-                        current_batch.append(file_path)
-                        current_batch_size += file_size
-                except Exception as e:
-                    print(f"Error reading {file_path}: {str(e)}")
-                    fail_queue.append(file_path)
+        :param data_config: A dictionary containing the configuration for the data, with the paths in 'files_list'
+            and optionally an 'upload_mode' from UPLOAD_MODES.
+        :return: A dictionary containing the response status and the list of successfully uploaded files.
+        """
+        try:
+            return self._upload_to_dataset(data_config, self._collect_upload_files(data_config))
 
-            if current_batch:
-                batches.append(current_batch)
+        except Exception as e:
+            raise LabellerrError(f"Failed to upload files: {str(e)}")
 
-            print('CPU count',cpu_count()," Batch Count",len(batches))
+    def _collect_upload_files(self, data_config):
+        """
+        Finds the local files to upload: those under data_config['folder_path'] when
+        it is given, otherwise the paths in data_config['files_list'].
 
-            # Calculate optimal number of workers based on CPU count and batch count
-            max_workers = min(
-                cpu_count(),  # Number of CPU cores
-                len(batches),  # Number of batches
-                20
+        :param data_config: The data configuration dictionary
+        :return: A list of (file path, size in bytes) tuples.
+        :raises LabellerrError: If a folder crosses the dataset limits while it is scanned.
+        """
+        extensions = DATA_TYPE_FILE_EXT[data_config['data_type']]
+        if 'folder_path' in data_config:
+            # a folder over the dataset limits is rejected as soon as the scan crosses them
+            return _scan_folder(
+                data_config['folder_path'],
+                extensions,
+                count_limit=TOTAL_FILES_COUNT_LIMIT_PER_DATASET,
+                size_limit=TOTAL_FILES_SIZE_LIMIT_PER_DATASET
             )
+        return _stat_files(data_config['files_list'], extensions)
 
-            # Process batches in parallel
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_batch = {
-                    executor.submit(self._process_batch, data_config, batch): batch 
-                    for batch in batches
-                }
+    def _check_upload(self, data_config, files):
+        """
+        Checks an upload against the dataset limits and the upload modes before anything is sent.
 
-                for future in as_completed(future_to_batch):
-                    batch = future_to_batch[future]
-                    try:
-                        result = future.result()
-                        if result['success']:
-                            success_queue.extend(batch)
-                        else:
-                            fail_queue.extend(batch)
-                    except Exception as e:
-                        print(f"Batch upload failed: {str(e)}")
-                        fail_queue.extend(batch)
+        :param data_config: The data configuration dictionary
+        :param files: List of (file path, size in bytes) tuples to upload
+        :raises LabellerrError: If the files exceed the dataset limits or the upload mode is unknown.
+        """
+        if data_config.get('upload_mode', 'batched') not in UPLOAD_MODES:
+            raise LabellerrError(f"Invalid upload_mode. Must be one of {UPLOAD_MODES}")
+        total_file_count = len(files)
+        total_file_volumn = sum(size for _, size in files)
+        if total_file_count > TOTAL_FILES_COUNT_LIMIT_PER_DATASET:
+            raise LabellerrError(f"Total file count: {total_file_count} where limit is {TOTAL_FILES_COUNT_LIMIT_PER_DATASET} is too many file to upload")
+        if total_file_volumn > TOTAL_FILES_SIZE_LIMIT_PER_DATASET:
+            raise LabellerrError(f"Total file size: {total_file_volumn/1024/1024:.1f}MB where the limit is {TOTAL_FILES_SIZE_LIMIT_PER_DATASET/1024/1024:.1f}MB is too large to upload")
+        logger.debug("Total file count: %d, total file size: %.1f MB", total_file_count, total_file_volumn/1024/1024)
+
+    def _upload_to_dataset(self, data_config, files):
+        """
+        Helper method that batches files and uploads the batches in parallel.
+
+        :param data_config: The data configuration dictionary
+        :param files: List of (file path, size in bytes) tuples to upload
+        :return: A dictionary containing the track id and the successful and failed files
+        :raises LabellerrError: If the files exceed the dataset limits or the upload mode is unknown.
+        """
+        self._check_upload(data_config, files)
+        upload_mode = data_config.get('upload_mode', 'batched')
+        unique_id = str(uuid.uuid4())
+        url = f"{self.base_url}/connectors/upload/local?" + urlencode({
+            'data_type': data_config['data_type'], 'dataset_id': data_config['dataset_id'], 'project_id': 'null',
+            'project_independent': 'false', 'client_id': data_config['client_id'], 'uuid': unique_id
+        })
+        data_config['url'] = url
+
+        success_queue = []
+        fail_queue = []
+
+        if upload_mode == 'per_file':
+            # many small files: one request each, so their latencies overlap across connections
+            batches = [[path] for path, _ in files]
+        else:
+            # Group files into batches based on FILE_BATCH_SIZE
+            batches = _pack_batches(files)
 
+        if not batches:
             return {
                 'track_id': unique_id,
                 'success': success_queue,
                 'fail': fail_queue
             }
-        
-        except Exception as e:
-            raise LabellerrError(f"Failed to upload files: {str(e)}")
 
-    def _process_batch(self, data_config, batch):
+        logger.debug("Batch count %d", len(batches))
+
+        # uploads wait on the network, not the CPU, so size the pool by the batch count
+        max_workers = min(len(batches), self.max_upload_concurrency)
+        # sizes from the scan, so the batches do not stat every file again
+        sizes = dict(files)
+
+        # Process batches in parallel
+        with ExitStack() as stack:
+            # whatever part of the upload lands changes the dataset and its listed file counts;
+            # dropped afterwards, so a lookup made during the upload is not kept either
+            stack.callback(self._invalidate_datasets)
+            executor = stack.enter_context(ThreadPoolExecutor(max_workers=max_workers))
+            future_to_batch = {
+                executor.submit(self._process_batch, data_config, batch, sizes): batch
+                for batch in batches
+            }
+
+            for future in as_completed(future_to_batch):
+                batch = future_to_batch[future]
+                try:
+                    result = future.result()
+                    if result['success']:
+                        success_queue.extend(batch)
+                    else:
+                        fail_queue.extend(batch)
+                except Exception as e:
+                    logger.warning("Batch upload failed: %s", e)
+                    fail_queue.extend(batch)
+
+        return {
+            'track_id': unique_id,
+            'success': success_queue,
+            'fail': fail_queue
+        }
+
+    def _process_batch(self, data_config, batch, sizes=None):
         """
         Helper method to process a batch of files.
 
         :param data_config: The data configuration dictionary
         :param batch: List of file paths to process
+        :param sizes: Optional dictionary of known file sizes by path; other files are stat'ed
         :return: Dictionary indicating success/failure
         """
         try:
-            files_list = []
-            for file_path in batch:
-                filename = os.path.basename(file_path)
-                try:
-                    with open(file_path, 'rb') as file_obj:
-                        files_list.append(
-                            ('file', (filename, file_obj, 'application/octet-stream'))
-                        )
-                except Exception as e:
-                    print(f"Error reading file {file_path}: {str(e)}")
-                    return {'success': False}
-            print(f"processing a batch of {len(files_list)} files . . .")
-            response = self.commence_files_upload(data_config, files_list)
-            print('----------------------')
-            print("Batch processing done ",response)
+            # each file is opened only while its part of the body is being sent; the
+            # stack closes whatever is still open if the upload stops half-way
+            with ExitStack() as stack:
+                files_list = []
+                for file_path in batch:
+                    try:
+                        file_obj = LazyFile(file_path, sizes.get(file_path) if sizes else None)
+                    except Exception as e:
+                        logger.warning("Error reading file %s: %s", file_path, e)
+                        return {'success': False}
+                    stack.callback(file_obj.close)
+                    files_list.append(
+                        ('file', (os.path.basename(file_path), file_obj, 'application/octet-stream'))
+                    )
+                logger.debug("processing a batch of %d files", len(files_list))
+                response = self.commence_files_upload(data_config, files_list)
+            logger.debug("Batch processing done: %s", response)
             return {'success': response}
         except Exception as e:
-            print(f"Batch processing error: {str(e)}")
+            logger.warning("Batch processing error: %s", e)
             return {'success': False}
 
     def commence_files_upload(self,data_config,files_to_send):
@@ -452,27 +1125,23 @@ class LabellerrClient:
         Commences the upload of files to the API.
 
         :param data_config: The dictionary containing the configuration for the data.
-        :param files_to_send: The list of files to send.
+        :param files_to_send: The list of (name, (filename, fileobj, content_type)) fields to send; the caller closes the files.
         :return: The response from the API.
         :raises LabellerrError: If the upload fails.
         """
         try:
-            print(f"Uploading {len(files_to_send)} file(s)")
-            # put a delay of 3 secs
-            time.sleep(3)
+            logger.debug("Uploading %d file(s)", len(files_to_send))
+            # stream the batch from disk instead of building the multipart body in memory
+            body = MultipartStream(files_to_send)
             headers = {
                     'client_id': data_config['client_id'],
-                    'api_key': self.api_key,
-                    'api_secret': self.api_secret,
-                    'source':'sdk',
-                    'origin': 'https://dev.labellerr.com'
+                    'Content-Type': body.content_type
                 }
             response=None
-            response = requests.post(
+            response = self._session.post(
                 data_config['url'], 
                 headers=headers, 
-                data={}, 
-                files=files_to_send
+                data=body
             )
             if response.status_code != 200:
                 raise LabellerrError(f"Failed to upload files: {response.status_code} - {response.text}")
@@ -481,13 +1150,6 @@ class LabellerrClient:
             raise LabellerrError(f"Request failed: {str(e)}")
         except Exception as e:
             raise LabellerrError(f"An error occurred during file upload: {str(e)}")
-        finally:
-            # Ensure all files are closed
-            for file_obj in files_to_send:
-                try:
-                    file_obj.close()
-                except:
-                    pass
 
     def upload_files(self,client_id,dataset_id,data_type,files_list):
 
@@ -520,7 +1182,7 @@ class LabellerrClient:
             
             return response
         except Exception as e:
-            logging.error(f"Failed to upload files : {str(e)}")
+            logger.error("Failed to upload files : %s", e)
             raise LabellerrError(f"Failed to upload files : {str(e)}")
 
     
@@ -539,8 +1201,13 @@ class LabellerrClient:
         """
         
         try:
-            if not os.path.exists(folder_path) or not os.path.isdir(folder_path) or not os.listdir(folder_path):
+            # isdir is a single stat that is also False for a missing path; one directory
+            # entry is enough to know the folder is not empty, so it is not listed in full
+            if not os.path.isdir(folder_path):
                 raise LabellerrError("Invalid or empty folder path")
+            with os.scandir(folder_path) as entries:
+                if next(entries, None) is None:
+                    raise LabellerrError("Invalid or empty folder path")
             
             config = {
                 'client_id': client_id,
@@ -555,42 +1222,35 @@ class LabellerrClient:
             
             return response
         except Exception as e:
-            logging.error(f"Failed to upload folder content: {str(e)}")
+            logger.error("Failed to upload folder content: %s", e)
             raise LabellerrError(f"Failed to upload folder content: {str(e)}")
         
     
         
 
-    def get_all_project_per_client_id(self,client_id):
+    def get_all_project_per_client_id(self,client_id,use_cache=True):
 
         """
         Retrieves a list of projects associated with a client ID.
 
         :param client_id: The ID of the client.
+        :param use_cache: Set to False to skip the cached list and fetch from the API.
         :return: A dictionary containing the list of projects.
         :raises LabellerrError: If the retrieval fails.
         """
-        try:
-            unique_id = str(uuid.uuid4())
-            url = f"{self.base_url}/project_drafts/projects/detailed_list?client_id={client_id}&uuid={unique_id}"
+        cache_key = ('get_all_project_per_client_id', client_id)
 
-            payload = {}
-            headers = {
-                'client_id': str(client_id),
-                'content-type': 'application/json',
-                'api_key': self.api_key,
-                'api_secret': self.api_secret,
-                'source':'sdk',
-                'origin': 'https://dev.labellerr.com'
-            }
+        def fetch():
+            try:
+                url = f"{self.base_url}/project_drafts/projects/detailed_list?" + urlencode({'client_id': client_id, 'uuid': _cache_buster()})
 
-            response = requests.request("GET", url, headers=headers, data=payload)
+                headers = {'client_id': str(client_id)}
+                return self._fetch_body(cache_key, url, headers, use_cache, "project retrieval failed")
+            except Exception as e:
+                logger.error("Failed to retrieve projects: %s", e)
+                raise LabellerrError(f"Failed to retrieve projects: {str(e)}")
 
-            print(response.text)
-            return response.json()
-        except Exception as e:
-            logging.error(f"Failed to retrieve projects: {str(e)}")
-            raise LabellerrError(f"Failed to retrieve projects: {str(e)}")
+        return self._read_cached(cache_key, use_cache, fetch)
 
     
                         
@@ -606,26 +1266,23 @@ class LabellerrClient:
         """
         try:
             unique_id = str(uuid.uuid4())
-            url = f"{self.base_url}/datasets/project/link?client_id={client_id}&dataset_id={dataset_id}&project_id={project_id}&uuid={unique_id}"
+            url = f"{self.base_url}/datasets/project/link?" + urlencode({
+                'client_id': client_id, 'dataset_id': dataset_id, 'project_id': project_id, 'uuid': unique_id
+            })
 
-            payload = {}
-            
-            headers = {
-                'client_id': str(client_id),
-                'content-type': 'application/json',
-                'api_key': self.api_key,
-                'api_secret': self.api_secret,
-                'source':'sdk',
-                'origin': 'https://dev.labellerr.com'
-            }            
-
-            response = requests.request("GET", url, headers=headers, data=payload)
-            response=response.json()
+            headers = {'client_id': str(client_id)}
+
+            response = self._session.request("GET", url, headers=headers)
+            response=_json_loads(response.content)
+            # the dataset has moved between the linked and unlinked listings, and the
+            # detailed project list shows what is linked to each project
+            self._invalidate_datasets()
+            self.invalidate_cache('get_all_project_per_client_id')
             response['track_id'] = unique_id
-            print(response)
+            logger.debug("dataset link response: %s", response)
             return response
         except Exception as e:
-            logging.error(f"Failed to link the data with the projects :{str(e)}")
+            logger.error("Failed to link the data with the projects :%s", e)
             raise LabellerrError(f"Failed to link the data with the projects : {str(e)}")
     
 
@@ -642,26 +1299,23 @@ class LabellerrClient:
         """
         unique_id = str(uuid.uuid4())
 
-        url = f"{self.base_url}/annotations/add_questions?project_id={config['project_id']}&auto_label={config['autolabel']}&data_type={config['data_type']}&client_id={config['client_id']}&uuid={unique_id}"
+        url = f"{self.base_url}/annotations/add_questions?" + urlencode({
+            'project_id': config['project_id'], 'auto_label': config['autolabel'], 'data_type': config['data_type'],
+            'client_id': config['client_id'], 'uuid': unique_id
+        })
 
-        guide_payload = json.dumps(config['annotation_guideline'])
+        guide_payload = _json_dumps(config['annotation_guideline'])
         
-        headers = {
-            'client_id': str(config['client_id']),
-            'content-type': 'application/json',
-            'api_key': self.api_key,
-            'api_secret': self.api_secret,
-            'source':'sdk',
-            'origin': 'https://dev.labellerr.com'
-        }    
+        headers = {'client_id': str(config['client_id'])}
 
-        print('annotation_guide -- ', guide_payload)
+        _log_payload("annotation_guide", guide_payload)
         try:
-            response = requests.request("POST", url, headers=headers, data=guide_payload)
-            print(' guideline update  ',response)
-            return response.json()
+            response = self._session.request("POST", url, headers=headers, data=guide_payload)
+            _log_response("guideline update", response)
+            self.invalidate_cache('get_all_project_per_client_id')
+            return _json_loads(response.content)
         except requests.exceptions.RequestException as e:
-            logging.error(f"Failed to update project annotation guideline: {str(e)}")
+            logger.error("Failed to update project annotation guideline: %s", e)
             raise LabellerrError(f"Failed to update project annotation guideline: {str(e)}")
         
     
@@ -690,9 +1344,57 @@ class LabellerrClient:
             raise LabellerrError("client_review_rotation_count must be 0 when annotation_rotation_count is greater than 1")
 
 
+    def _upload_preannotation_request(self, project_id, client_id, annotation_format, annotation_file):
+        """
+        Sends a preannotation file to a project and records the started job on the
+        client for preannotation_job_status_async.
+
+        :param project_id: The ID of the project.
+        :param client_id: The ID of the client.
+        :param annotation_format: The format of the preannotation data.
+        :param annotation_file: The file path of the preannotation data.
+        :return: The ID of the preannotation job.
+        :raises LabellerrError: If the arguments are invalid or the API rejects the upload.
+        """
+        if annotation_format not in ANNOTATION_FORMAT:
+            raise LabellerrError(f"Invalid annotation_format. Must be one of {ANNOTATION_FORMAT}")
+
+        url = f"{self.base_url}/actions/upload_answers?" + urlencode({
+            'project_id': project_id, 'answer_format': annotation_format, 'client_id': client_id
+        })
+
+        # a single stat; directories are rejected too
+        if not os.path.isfile(annotation_file):
+            raise LabellerrError("File not found")
+        file_name = os.path.basename(annotation_file)
+
+        # stream the file into the request instead of building the multipart body in memory
+        with open(annotation_file, 'rb', buffering=FILE_READ_BUFFER) as f:
+            body = MultipartStream([
+                ('file', (file_name, f, 'application/octet-stream'))
+            ])
+            response = self._session.request("POST", url, headers={
+                'client_id': client_id,
+                'email_id': self.api_key,
+                'Content-Type': body.content_type
+            }, data=body)
+        if response.status_code != 200:
+            raise LabellerrError(f"Failed to upload preannotation: {response.text}")
+        response_data=_json_loads(response.content)
+        logger.debug("preannotation upload response: %s", response_data)
+        # read job_id from the response
+        job_id = response_data['response']['job_id']
+        self.client_id = client_id
+        self.job_id = job_id
+        self.project_id = project_id
+
+        logger.debug("preannotation upload accepted, job id %s", job_id)
+        return job_id
+
     def _upload_preannotation_sync(self, project_id, client_id, annotation_format, annotation_file):
         """
-        Synchronous implementation of preannotation upload.
+        Synchronous implementation of preannotation upload: sends the file, then
+        waits for the job to complete.
 
         :param project_id: The ID of the project.
         :param client_id: The ID of the client.
@@ -702,51 +1404,10 @@ class LabellerrClient:
         :raises LabellerrError: If the upload fails.
         """
         try:
-            # validate all the parameters
-            required_params = ['project_id', 'client_id', 'annotation_format', 'annotation_file']
-            for param in required_params:
-                if param not in locals():
-                    raise LabellerrError(f"Required parameter {param} is missing")
-                
-            if annotation_format not in ANNOTATION_FORMAT:
-                raise LabellerrError(f"Invalid annotation_format. Must be one of {ANNOTATION_FORMAT}")
-            
-            url = f"{self.base_url}/actions/upload_answers?project_id={project_id}&answer_format={annotation_format}&client_id={client_id}"
-
-            # validate if the file exist then extract file name from the path
-            if os.path.exists(annotation_file):
-                file_name = os.path.basename(annotation_file)
-            else:
-                raise LabellerrError("File not found")
-
-            payload = {}
-            with open(annotation_file, 'rb') as f:
-                files = [
-                    ('file', (file_name, f, 'application/octet-stream'))
-                ]
-                response = requests.request("POST", url, headers={
-                    'client_id': client_id,
-                    'api_key': self.api_key,
-                    'api_secret': self.api_secret,
-                    'origin': 'https://dev.labellerr.com',
-                    'source':'sdk',
-                    'email_id': self.api_key
-                }, data=payload, files=files)
-            response_data=response.json()
-            print('response_data -- ', response_data)
-            # read job_id from the response
-            job_id = response_data['response']['job_id']
-            self.client_id = client_id
-            self.job_id = job_id
-            self.project_id = project_id
-
-            print(f"Preannotation upload successful. Job ID: {job_id}")
-            if response.status_code != 200:
-                raise LabellerrError(f"Failed to upload preannotation: {response.text}")
-            
-            return self.preannotation_job_status()
+            job_id = self._upload_preannotation_request(project_id, client_id, annotation_format, annotation_file)
+            return self._poll_until_complete(project_id, job_id, client_id)
         except Exception as e:
-            logging.error(f"Failed to upload preannotation: {str(e)}")
+            logger.error("Failed to upload preannotation: %s", e)
             raise LabellerrError(f"Failed to upload preannotation: {str(e)}")
 
     def upload_preannotation_by_project_id_async(self, project_id, client_id, annotation_format, annotation_file):
@@ -757,120 +1418,173 @@ class LabellerrClient:
         :param client_id: The ID of the client.
         :param annotation_format: The format of the preannotation data.
         :param annotation_file: The file path of the preannotation data.
-        :return: A Future object that will contain the response from the API.
+        :return: A Future object that will contain the response from the API. It runs on the
+            client's worker threads, so call close() or use the client as a context manager when done.
         :raises LabellerrError: If the upload fails.
         """
-        def upload_and_monitor():
-            try:
-                # validate all the parameters
-                required_params = ['project_id', 'client_id', 'annotation_format', 'annotation_file']
-                for param in required_params:
-                    if param not in locals():
-                        raise LabellerrError(f"Required parameter {param} is missing")
-                    
-                if annotation_format not in ANNOTATION_FORMAT:
-                    raise LabellerrError(f"Invalid annotation_format. Must be one of {ANNOTATION_FORMAT}")
-                
-                url = f"{self.base_url}/actions/upload_answers?project_id={project_id}&answer_format={annotation_format}&client_id={client_id}"
-
-                # validate if the file exist then extract file name from the path
-                if os.path.exists(annotation_file):
-                    file_name = os.path.basename(annotation_file)
-                else:
-                    raise LabellerrError("File not found")
-
-                payload = {}
-                with open(annotation_file, 'rb') as f:
-                    files = [
-                        ('file', (file_name, f, 'application/octet-stream'))
-                    ]
-                    response = requests.request("POST", url, headers={
-                        'client_id': client_id,
-                        'api_key': self.api_key,
-                        'api_secret': self.api_secret,
-                        'origin': 'https://dev.labellerr.com',
-                        'source':'sdk',
-                        'email_id': self.api_key
-                    }, data=payload, files=files)
-                response_data=response.json()
-                print('response_data -- ', response_data)
-                # read job_id from the response
-                job_id = response_data['response']['job_id']
-                self.client_id = client_id
-                self.job_id = job_id
-                self.project_id = project_id
-
-                print(f"Preannotation upload successful. Job ID: {job_id}")
-                if response.status_code != 200:
-                    raise LabellerrError(f"Failed to upload preannotation: {response.text}")
-                
-                # Now monitor the status
-                headers = {
-                    'client_id': str(self.client_id),
-                    'Origin': 'https://app.labellerr.com',
-                    'api_key': self.api_key,
-                    'api_secret': self.api_secret
-                }
-                status_url = f"{self.base_url}/actions/upload_answers_status?project_id={self.project_id}&job_id={self.job_id}&client_id={self.client_id}"
-                while True:
-                    try:
-                        response = requests.request("GET", status_url, headers=headers, data={})
-                        status_data = response.json()
-                        
-                        print(' >>> ', status_data)
-
-                        # Check if job is completed
-                        if status_data.get('response', {}).get('status') == 'completed':
-                            return status_data
-                            
-                        print('retrying after 5 seconds . . .')
-                        time.sleep(5)
-                        
-                    except Exception as e:
-                        logging.error(f"Failed to get preannotation job status: {str(e)}")
-                        raise LabellerrError(f"Failed to get preannotation job status: {str(e)}")
-                
-            except Exception as e:
-                logging.error(f"Failed to upload preannotation: {str(e)}")
-                raise LabellerrError(f"Failed to upload preannotation: {str(e)}")
-
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            return executor.submit(upload_and_monitor)
+        return self._executor.submit(
+            self._upload_preannotation_sync, project_id, client_id, annotation_format, annotation_file
+        )
 
     def preannotation_job_status_async(self):
         """
         Get the status of a preannotation job asynchronously.
         
         Returns:
-            concurrent.futures.Future: A future that will contain the final job status
+            futures.Future: A future that will contain the final job status
         """
+        project_id, job_id, client_id = self.project_id, self.job_id, self.client_id
+
         def check_status():
-            headers = {
-                'client_id': str(self.client_id),
-                'Origin': 'https://app.labellerr.com',
-                'api_key': self.api_key,
-                'api_secret': self.api_secret
-            }
-            url = f"{self.base_url}/actions/upload_answers_status?project_id={self.project_id}&job_id={self.job_id}&client_id={self.client_id}"
-            payload = {}
-            while True:
-                try:
-                    response = requests.request("GET", url, headers=headers, data=payload)
-                    response_data = response.json()
-                    
-                    # Check if job is completed
-                    if response_data.get('response', {}).get('status') == 'completed':
-                        return response_data
-                        
-                    print('retrying after 5 seconds . . .')
-                    time.sleep(5)
-                    
-                except Exception as e:
-                    logging.error(f"Failed to get preannotation job status: {str(e)}")
-                    raise LabellerrError(f"Failed to get preannotation job status: {str(e)}")
+            return self._poll_until_complete(project_id, job_id, client_id)
         
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            return executor.submit(check_status)
+        return self._executor.submit(check_status)
+
+    def preannotation_jobs_status_async(self, jobs):
+        """
+        Waits for several preannotation jobs at once. A single background loop
+        checks every unfinished job in parallel, then sleeps once for all of them
+        with the same backoff as a single job, instead of each job polling on its own.
+
+        :param jobs: An iterable of (project_id, job_id, client_id) tuples.
+        :return: A list of futures, one per job in the given order, each resolving to the final job status.
+        """
+        jobs = list(jobs)
+        results = [futures.Future() for _ in jobs]
+        # a job listed twice is polled once and resolves both futures
+        pending = {}
+        for (project_id, job_id, client_id), future in zip(jobs, results):
+            pending.setdefault((project_id, job_id), (client_id, []))[1].append(future)
+
+        def poll_all():
+            try:
+                schedule = _PollSchedule(self.max_poll_wait)
+                while pending:
+                    checks = {
+                        key: self._io_pool.submit(self._fetch_job_status, key[0], key[1], client_id)
+                        for key, (client_id, _) in pending.items()
+                    }
+                    max_age = POLL_MAX_DELAY
+                    retry_after = 0
+                    for key, check in checks.items():
+                        try:
+                            status_data, job_max_age, job_retry_after = check.result()
+                        except Exception as e:
+                            for future in pending.pop(key)[1]:
+                                future.set_exception(e)
+                            continue
+                        if status_data is not None:
+                            for future in pending.pop(key)[1]:
+                                future.set_result(status_data)
+                        else:
+                            # wake up as soon as any pending status may have changed, but
+                            # not before the server has asked to be left alone
+                            max_age = min(max_age, job_max_age)
+                            retry_after = max(retry_after, job_retry_after)
+                    if not pending:
+                        break
+                    wait = schedule.next_wait(max_age, retry_after)
+                    if wait is None:
+                        for key, (_, waiting) in pending.items():
+                            for future in waiting:
+                                future.set_exception(schedule.timeout_error(key[1]))
+                        pending.clear()
+                        break
+                    logger.debug("%d preannotation jobs not completed, checking again in %.1f s", len(pending), wait)
+                    time.sleep(wait)
+            except BaseException as e:
+                # a failure outside the status checks (e.g. the client closed under the
+                # loop) must still resolve every waiting caller
+                for _, waiting in pending.values():
+                    for future in waiting:
+                        future.set_exception(e)
+                pending.clear()
+
+        if pending:
+            self._executor.submit(poll_all)
+        return results
+
+    def _fetch_job_status(self, project_id, job_id, client_id):
+        """
+        Checks the status of a preannotation job once. The status is revalidated
+        with If-None-Match when the server sent an ETag, so an unchanged status
+        comes back as an empty 304.
+
+        :param project_id: The ID of the project.
+        :param job_id: The ID of the preannotation job.
+        :param client_id: The ID of the client.
+        :return: A (status, max_age, retry_after) tuple: the job status once the job has completed, otherwise
+            None, the number of seconds the server says the status stays unchanged (max-age), and the number
+            of seconds a 429 or 503 reply asks the client to wait (Retry-After).
+        :raises LabellerrError: If the status request fails, or the job failed, was cancelled or ended in error.
+        """
+        cache_key = (project_id, job_id)
+        status_data = self._job_status_cache.get(cache_key)
+        if status_data is not None:
+            return _job_outcome(job_id, status_data), 0, 0
+
+        url = f"{self.base_url}/actions/upload_answers_status?" + urlencode({
+            'project_id': project_id, 'job_id': job_id, 'client_id': client_id
+        })
+        headers = {
+            'client_id': str(client_id),
+            'Origin': 'https://app.labellerr.com'
+        }
+        validator = self._job_status_etags.get(cache_key)
+        if validator:
+            headers['If-None-Match'] = validator[0]
+        try:
+            response = self._session.request("GET", url, headers=headers)
+            if response.status_code in (429, 503):
+                # rate limited or unavailable even after the session's retries; the body is
+                # an error page, so only the requested wait is taken from the reply
+                logger.debug("preannotation job status: HTTP %s, backing off", response.status_code)
+                return None, 0, _retry_after(response.headers)
+            if response.status_code == 304 and validator:
+                status_data = validator[1]
+            else:
+                status_data = _json_loads(response.content)
+        except Exception as e:
+            logger.error("Failed to get preannotation job status: %s", e)
+            raise LabellerrError(f"Failed to get preannotation job status: {str(e)}")
+
+        job = status_data.get('response') if isinstance(status_data, dict) else None
+        if not isinstance(job, dict):
+            raise LabellerrError(f"Failed to get preannotation job status: unexpected response {response.text[:LOG_PAYLOAD_LIMIT]}")
+        if job.get('status') in JOB_FINAL_STATUSES:
+            # a finished job's status never changes
+            self._job_status_cache.set(cache_key, status_data)
+            self._job_status_etags.pop(cache_key, None)
+            return _job_outcome(job_id, status_data), 0, 0
+
+        etag = response.headers.get('ETag')
+        if etag:
+            self._job_status_etags[cache_key] = (etag, status_data)
+        return None, _max_age(response.headers), 0
+
+    def _poll_until_complete(self, project_id, job_id, client_id):
+        """
+        Polls the status of a preannotation job until it completes, waiting
+        between checks as _PollSchedule sets out, so short jobs are seen quickly
+        and long ones do not flood the status endpoint.
+
+        :param project_id: The ID of the project.
+        :param job_id: The ID of the preannotation job.
+        :param client_id: The ID of the client.
+        :return: The final job status.
+        :raises LabellerrError: If a status request fails or the job does not complete within max_poll_wait seconds.
+        """
+        schedule = _PollSchedule(self.max_poll_wait)
+        while True:
+            status_data, max_age, retry_after = self._fetch_job_status(project_id, job_id, client_id)
+            if status_data is not None:
+                return status_data
+
+            wait = schedule.next_wait(max_age, retry_after)
+            if wait is None:
+                raise schedule.timeout_error(job_id)
+            logger.debug("preannotation job %s not completed, checking again in %.1f s", job_id, wait)
+            time.sleep(wait)
 
     def upload_preannotation_by_project_id(self,project_id,client_id,annotation_format,annotation_file):
 
@@ -884,63 +1598,10 @@ class LabellerrClient:
         :return: The response from the API.
         :raises LabellerrError: If the upload fails.
         """
-        try:
-            # validate all the parameters
-            required_params = ['project_id', 'client_id', 'annotation_format', 'annotation_file']
-            for param in required_params:
-                if param not in locals():
-                    raise LabellerrError(f"Required parameter {param} is missing")
-                
-            if annotation_format not in ANNOTATION_FORMAT:
-                raise LabellerrError(f"Invalid annotation_format. Must be one of {ANNOTATION_FORMAT}")
-            
-
-            url = f"{self.base_url}/actions/upload_answers?project_id={project_id}&answer_format={annotation_format}&client_id={client_id}"
-
-            # validate if the file exist then extract file name from the path
-            if os.path.exists(annotation_file):
-                file_name = os.path.basename(annotation_file)
-            else:
-                raise LabellerrError("File not found")
-
-            payload = {}
-            with open(annotation_file, 'rb') as f:
-                files = [
-                    ('file', (file_name, f, 'application/octet-stream'))
-                ]
-                response = requests.request("POST", url, headers={
-                    'client_id': client_id,
-                    'api_key': self.api_key,
-                    'api_secret': self.api_secret,
-                    'origin': 'https://dev.labellerr.com',
-                    'source':'sdk',
-                    'email_id': self.api_key
-                }, data=payload, files=files)
-            response_data=response.json()
-            print('response_data -- ', response_data)
-            # read job_id from the response
-            job_id = response_data['response']['job_id']
-            self.client_id = client_id
-            self.job_id = job_id
-            self.project_id = project_id
-
-            print(f"Preannotation upload successful. Job ID: {job_id}")
-            if response.status_code != 200:
-                raise LabellerrError(f"Failed to upload preannotation: {response.text}")
-            
-            future = self.preannotation_job_status_async()
-            return future.result() 
-        except Exception as e:
-            logging.error(f"Failed to upload preannotation: {str(e)}")
-            raise LabellerrError(f"Failed to upload preannotation: {str(e)}")
+        return self._upload_preannotation_sync(project_id, client_id, annotation_format, annotation_file)
 
     def create_local_export(self,project_id,client_id,export_config):
 
-        required_params = ['project_id', 'client_id', 'export_config']
-        for param in required_params:
-            if param not in locals():
-                raise LabellerrError(f"Required parameter {param} is missing")
-
         if export_config is None:
             raise LabellerrError("export_config is null")
 
@@ -951,20 +1612,14 @@ class LabellerrClient:
                     "all"
                 ]
             })
-            payload = json.dumps(export_config)
-            response = requests.post(
-                f"{self.base_url}/sdk/export/files?project_id={project_id}&client_id={client_id}",
-                headers={
-                    'api_key': self.api_key,
-                    'api_secret': self.api_secret,
-                    'Origin': 'https://dev.labellerr.com',
-                    'Content-Type': 'application/json'
-                },
+            payload = _json_dumps(export_config)
+            response = self._session.post(
+                f"{self.base_url}/sdk/export/files?" + urlencode({'project_id': project_id, 'client_id': client_id}),
                 data=payload
             )
-            return response.json()
+            return _json_loads(response.content)
         except requests.exceptions.RequestException as e:
-            logging.error(f"Failed to create local export: {str(e)}")
+            logger.error("Failed to create local export: %s", e)
             raise LabellerrError(f"Failed to create local export: {str(e)}")
 
     def initiate_create_project(self,payload):
@@ -979,106 +1634,107 @@ class LabellerrClient:
         
         try:
             result={}
-            print('Payload  >>> ',payload)
+            _log_payload("Payload", payload)
 
             # validate all the parameters
-            required_params = ['client_id', 'dataset_name', 'dataset_description', 'data_type', 'created_by', 'project_name','annotation_guide','autolabel']
-            for param in required_params:
+            for param in CREATE_PROJECT_REQUIRED_PARAMS:
                 if param not in payload:
                     raise LabellerrError(f"Required parameter {param} is missing")
-                if(param == 'client_id'):
-                    # it should be an instance of string
-                    if not isinstance(payload[param], str) or not payload[param].strip():
-                        raise LabellerrError(f"client_id must be a string")
-                
-        
+            client_id = payload['client_id']
+            data_type = payload['data_type']
+            # it should be an instance of string
+            if not isinstance(client_id, str) or not client_id.strip():
+                raise LabellerrError(f"client_id must be a string")
+
             if 'rotation_config' in payload:
                 self.validate_rotation_config(payload['rotation_config'])
             else:
-                payload['rotation_config'] = {
-                    'annotation_rotation_count':1,
-                    'review_rotation_count':1,
-                    'client_review_rotation_count':1
-                }
-            
-            if payload['data_type'] not in DATA_TYPES:
+                payload['rotation_config'] = dict(DEFAULT_ROTATION_CONFIG)
+
+            if data_type not in DATA_TYPES:
                 raise LabellerrError(f"Invalid data_type. Must be one of {DATA_TYPES}")
 
+            files_to_upload = payload.get('files_to_upload')
+            folder_to_upload = payload.get('folder_to_upload')
             if 'files_to_upload' in payload and 'folder_to_upload' in payload:
                 raise LabellerrError("Both files_to_upload and folder_to_upload cannot be provided at the same time.")
-            elif 'files_to_upload' not in payload and 'folder_to_upload' not in payload:
-                raise LabellerrError("Either files_to_upload or folder_to_upload must be provided.")
+            elif 'files_to_upload' in payload:
+                if not files_to_upload:
+                    raise LabellerrError("files_to_upload must be a non-empty list.")
+            elif 'folder_to_upload' in payload:
+                if not isinstance(folder_to_upload, str) or not folder_to_upload.strip():
+                    raise LabellerrError("folder_to_upload must be a non-empty string.")
             else:
-                if 'files_to_upload' in payload:
-                    if payload['files_to_upload'] is None and len(payload['files_to_upload'])==0:
-                        raise LabellerrError("files_to_upload must be a non-empty string.")
-                elif 'folder_to_upload' in payload:
-                    if not isinstance(payload['folder_to_upload'], str) or not payload['folder_to_upload'].strip():
-                        raise LabellerrError("folder_to_upload must be a non-empty string.")
-                
+                raise LabellerrError("Either files_to_upload or folder_to_upload must be provided.")
 
             response = self.create_dataset({
-                'client_id': payload['client_id'],
+                'client_id': client_id,
                 'dataset_name': payload['project_name'],
-                'data_type': payload['data_type'],
+                'data_type': data_type,
                 'dataset_description': payload['dataset_description'],
                 'created_by': payload['created_by']
             })
-            print('Dataset creation response ',response)
+            _log_payload("Dataset creation response", response)
 
             dataset_id = response['dataset_id']
             result['dataset_id'] = dataset_id
 
-            # now upload local files/folder to dataset
-            if 'files_to_upload' in payload and payload['files_to_upload'] is not None:
-                data=self.upload_files_to_dataset({
-                    'client_id': payload['client_id'],
-                    'dataset_id': dataset_id,
-                    'data_type': payload['data_type'],
-                    'files_list': payload['files_to_upload']
-                })
-                result['dataset_files'] = data
-
-            elif 'folder_to_upload' in payload and payload['folder_to_upload'] is not None:
-                data=self.upload_folder_files_to_dataset({
-                    'client_id': payload['client_id'],
-                    'dataset_id': dataset_id,
-                    'data_type': payload['data_type'],
-                    'folder_path': payload['folder_to_upload']
-                })
-                result['dataset_files'] = data
+            def set_up_project():
+                response = self.create_empty_project(client_id, payload['project_name'], data_type, payload['rotation_config'])
+                # update the project annotation guideline
+                try:
+                    guideline={
+                        "project_id":response['project_id'],
+                        "client_id":client_id,
+                        "autolabel":payload['autolabel'],
+                        "data_type": data_type,
+                        "annotation_guideline":payload['annotation_guide']
+                    }
+                    guideline_update=self.update_project_annotation_guideline(guideline)
+                except Exception as e:
+                    logger.error("Failed to update project annotation guideline: %s", e)
+                    raise LabellerrError(f"Failed to update project annotation guideline: {str(e)}")
+                return response, guideline_update
 
-            # create empty project
-            response = self.create_empty_project(payload['client_id'], payload['project_name'], payload['data_type'],payload['rotation_config'])
+            upload_config = {
+                'client_id': client_id,
+                'dataset_id': dataset_id,
+                'data_type': data_type
+            }
+            if files_to_upload:
+                upload_config['files_list'] = files_to_upload
+            else:
+                upload_config['folder_path'] = folder_to_upload
+            # the local files are found and checked against the dataset limits first, so
+            # a rejected upload never leaves a project behind
+            try:
+                files = self._collect_upload_files(upload_config)
+                self._check_upload(upload_config, files)
+            except Exception as e:
+                raise LabellerrError(f"Failed to upload files: {str(e)}")
+
+            # the project does not depend on the files, so it is created and configured
+            # while they upload; only the final link needs both
+            project_future = self._io_pool.submit(set_up_project)
+            try:
+                # now upload local files/folder to dataset
+                result['dataset_files'] = self._upload_to_dataset(upload_config, files)
+            finally:
+                # never leave project setup running behind a failed upload
+                futures.wait([project_future])
 
+            response, guideline_update = project_future.result()
             project_id = response['project_id']
             result['project_id'] = project_id
-            result['project_config'] = response['project_config']   
-
-            # update the project annotation guideline 
-            # if 'annotation_guide' in payload and 'autolabel' in payload:
-            try:
-                guideline={
-                    "project_id":project_id,
-                    "client_id":payload['client_id'],
-                    "autolabel":payload['autolabel'],
-                    "data_type": payload['data_type'],
-                    "annotation_guideline":payload['annotation_guide']
-                }
-                guideline_update=self.update_project_annotation_guideline(guideline)
-                result['annotation_guide']=guideline_update
-            except Exception as e:
-                logging.error(f"Failed to update project annotation guideline: {str(e)}")
-                print(result)
-                raise LabellerrError(f"Failed to update project annotation guideline: {str(e)}")
-        
+            result['project_config'] = response['project_config']
+            result['annotation_guide']=guideline_update
 
             # link dataset to project
-            data=self.link_dataset_to_project(payload['client_id'],project_id,dataset_id)
+            data=self.link_dataset_to_project(client_id,project_id,dataset_id)
             result['dataset_project_link'] = data
             result['response'] = 'success'
             return result
         except Exception as e:
-            logging.error(f"Failed to create project: {str(e)}")
-            print(result)
+            logger.error("Failed to create project: %s", e)
+            logger.debug("partial project creation result: %s", result)
             raise LabellerrError(f"Failed to create project: {str(e)}")
@@ -0,0 +1,64 @@
+# labellerr/http2.py
+
+import requests
+
+try:
+    import httpx
+except ImportError:  # optional, see extras_require['http2']
+    httpx = None
+
+
+class Http2Session:
+    """
+    A requests.Session look-alike backed by an HTTP/2 httpx.Client.
+
+    Concurrent calls from several threads are multiplexed as streams over one
+    TLS connection per host instead of each opening its own HTTP/1.1 socket.
+    Only the subset of the requests API used by LabellerrClient is provided.
+    """
+    def __init__(self, max_connections, max_keepalive_connections, retries=0):
+        """
+        :param max_connections: The maximum number of open connections.
+        :param max_keepalive_connections: The number of idle connections kept alive.
+        :param retries: The number of times a failed connection attempt is retried.
+        """
+        if httpx is None:
+            raise ImportError("HTTP/2 support requires httpx: pip install 'httpx[http2]'")
+        transport = httpx.HTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections),
+            retries=retries
+        )
+        self._client = httpx.Client(transport=transport, timeout=None)
+        self.headers = self._client.headers
+
+    def request(self, method, url, headers=None, data=None, files=None, params=None, json=None):
+        """
+        Sends a request, translating httpx transport errors into requests exceptions
+        so existing error handling keeps working.
+
+        :return: An httpx.Response, which exposes status_code, text, content, headers and json().
+        """
+        content = None
+        if isinstance(data, (bytes, str)) or hasattr(data, 'read'):
+            # raw and streamed bodies (e.g. MultipartStream) go out as content
+            content, data = data, None
+            if hasattr(content, 'read') and hasattr(content, '__len__'):
+                headers = {**(headers or {}), 'Content-Length': str(len(content))}
+        elif not data:
+            data = None
+        try:
+            return self._client.request(
+                method, url, headers=headers, params=params, data=data, content=content, files=files, json=json
+            )
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e))
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def close(self):
+        self._client.close()
@@ -0,0 +1,150 @@
+# labellerr/multipart.py
+
+import io
+import os
+import uuid
+
+UPLOAD_CHUNK_SIZE=64 * 1024
+## files are read from disk in blocks this large, whatever size the HTTP layer asks for
+FILE_READ_BUFFER=256 * 1024
+## characters percent-encoded in quoted part header values, as urllib3 and browsers do
+HEADER_PARAM_ESCAPES={10: '%0A', 13: '%0D', 34: '%22'}
+
+
+def _header_param(name, value):
+    """
+    Formats one quoted Content-Disposition parameter, percent-encoding the
+    characters that would end the value or the header line early.
+    """
+    return f'{name}="{value.translate(HEADER_PARAM_ESCAPES)}"'
+
+
+class LazyFile:
+    """
+    A binary file that is opened on its first read and closed as soon as it has
+    been read to the end, so a multipart body made of many of them keeps only one
+    file descriptor open at a time. No more than size bytes are ever returned, so
+    a file that grows while it is sent cannot overrun the declared Content-Length.
+    """
+    def __init__(self, path, size=None):
+        """
+        :param path: The path of the file.
+        :param size: The size of the file in bytes, if already known; otherwise it is stat'ed.
+        :raises OSError: If the file cannot be stat'ed.
+        """
+        self.path = path
+        self.size = os.path.getsize(path) if size is None else size
+        self._file = None
+        self._remaining = self.size
+        self.closed = False
+
+    def read(self, size=-1):
+        if self.closed:
+            return b''
+        if self._file is None:
+            self._file = open(self.path, 'rb', buffering=FILE_READ_BUFFER)
+        if size is None or size < 0 or size > self._remaining:
+            size = self._remaining
+        chunk = self._file.read(size) if size else b''
+        self._remaining -= len(chunk)
+        if not chunk or not self._remaining:
+            self.close()
+        return chunk
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.closed = True
+
+
+def _remaining_size(fileobj):
+    """
+    Returns the number of bytes left to read from an open binary file.
+    """
+    if isinstance(fileobj, LazyFile):
+        return 0 if fileobj.closed else fileobj.size
+    try:
+        return os.fstat(fileobj.fileno()).st_size - fileobj.tell()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        position = fileobj.tell()
+        end = fileobj.seek(0, io.SEEK_END)
+        fileobj.seek(position)
+        return end - position
+
+
+class MultipartStream:
+    """
+    A multipart/form-data request body that is read from the files as it is
+    sent, instead of being assembled in memory first.
+
+    Pass it as ``data=`` with ``content_type`` as the Content-Type header; its
+    length is known up front, so requests sends a Content-Length rather than
+    chunked encoding.
+    """
+    def __init__(self, fields, chunk_size=UPLOAD_CHUNK_SIZE):
+        """
+        :param fields: A list of (name, (filename, fileobj, content_type)) tuples, as for requests' files=;
+            a fileobj may be a LazyFile that has not been opened yet.
+        :param chunk_size: The size of the chunks yielded when iterating.
+        """
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self.chunk_size = chunk_size
+
+        self._segments = []
+        length = 0
+        for name, (filename, fileobj, content_type) in fields:
+            header = (
+                f'--{self.boundary}\r\n'
+                f'Content-Disposition: form-data; {_header_param("name", name)}; {_header_param("filename", filename)}\r\n'
+                f'Content-Type: {content_type}\r\n\r\n'
+            ).encode()
+            self._segments.extend((header, fileobj, b'\r\n'))
+            length += len(header) + _remaining_size(fileobj) + 2
+        closing = f'--{self.boundary}--\r\n'.encode()
+        self._segments.append(closing)
+        self.len = length + len(closing)
+
+        self._index = 0
+        self._offset = 0
+
+    def __len__(self):
+        return self.len
+
+    def read(self, size=-1):
+        """
+        Reads up to size bytes of the encoded body.
+
+        :param size: The maximum number of bytes to return; negative reads everything left.
+        :return: The next bytes of the body, or b'' once it has been fully read.
+        """
+        if size is None or size < 0:
+            size = self.len
+        # collect the pieces and join once; a read served by a single file read is
+        # returned as-is, without being copied again
+        pieces = []
+        wanted = size
+        while wanted > 0 and self._index < len(self._segments):
+            segment = self._segments[self._index]
+            if isinstance(segment, bytes):
+                chunk = segment[self._offset:self._offset + wanted]
+                self._offset += len(chunk)
+                if self._offset >= len(segment):
+                    self._index += 1
+                    self._offset = 0
+            else:
+                chunk = segment.read(wanted)
+                if not chunk:
+                    self._index += 1
+                    continue
+            pieces.append(chunk)
+            wanted -= len(chunk)
+        return b''.join(pieces)
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
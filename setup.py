@@ -10,6 +10,11 @@ setup(
         "requests",
         "unique_names_generator"
     ],
+    extras_require={
+        "fast": ["orjson", "brotli"],
+        "http2": ["httpx[http2]"],
+        "dotenv": ["python-dotenv"]
+    },
     description="Python SDK for Labellerr API",
     author="Your Name",
     author_email="your.email@example.com",
@@ -0,0 +1,61 @@
+import unittest
+import asyncio
+from unittest import mock
+from labellerr.async_client import AsyncLabellerrClient
+
+# RUNNING
+# python -m unittest discover -s tests
+
+
+class TestAsyncLabellerrClient(unittest.TestCase):
+    def setUp(self):
+        self.client = AsyncLabellerrClient('api_key', 'api_secret')
+        self.client.client = mock.Mock()
+        self.client.client.get_all_project_per_client_id.return_value = {'response': []}
+        self.client.client.get_all_dataset.return_value = {'linked': [], 'unlinked': []}
+
+    def tearDown(self):
+        self.client._executor.shutdown(wait=True)
+
+    def test_gather_independent_calls(self):
+        async def run():
+            return await asyncio.gather(
+                self.client.get_all_project_per_client_id('1'),
+                self.client.get_all_dataset('1', 'image', 'project_1', 'project'),
+            )
+
+        projects, datasets = asyncio.run(run())
+
+        self.assertEqual(projects, {'response': []})
+        self.assertEqual(datasets, {'linked': [], 'unlinked': []})
+        self.client.client.get_all_dataset.assert_called_once_with('1', 'image', 'project_1', 'project', use_cache=True)
+
+    def test_uploads_awaitable_together(self):
+        self.client.client.upload_folder_files_to_dataset.side_effect = lambda config: {'track_id': config['dataset_id']}
+
+        async def run():
+            return await asyncio.gather(*(
+                self.client.upload_folder_files_to_dataset({'dataset_id': dataset_id}) for dataset_id in ('d1', 'd2')
+            ))
+
+        results = asyncio.run(run())
+
+        self.assertEqual([result['track_id'] for result in results], ['d1', 'd2'])
+
+    def test_preannotation_waits_without_holding_a_thread(self):
+        self.client.client.max_poll_wait = 60
+        self.client.client._upload_preannotation_request.return_value = 'job_1'
+        self.client.client._fetch_job_status.side_effect = [
+            (None, 0, 0), ({'response': {'status': 'completed'}}, 0, 0)
+        ]
+
+        with mock.patch('labellerr.async_client.asyncio.sleep', new=mock.AsyncMock()) as sleep:
+            result = asyncio.run(self.client.upload_preannotation_by_project_id('p1', '1', 'json', 'answers.json'))
+
+        self.assertEqual(result, {'response': {'status': 'completed'}})
+        sleep.assert_awaited_once()
+        self.client.client._fetch_job_status.assert_called_with('p1', 'job_1', '1')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,17 @@
 import unittest
+import contextlib
+import io
 from labellerr.client import LabellerrClient
+from labellerr import client as client_module
 from labellerr.exceptions import LabellerrError
+from labellerr.cache import DiskCache
 import json
+import os
 import uuid
 import threading
 import time
+import tempfile
+from unittest import mock
 # RUNNING
 # python -m unittest discover -s tests
 
@@ -341,5 +348,820 @@ class TestLabellerrClient(unittest.TestCase):
     #         print(f"An error occurred: {e}")
     #         raise
 
+
+class TestLabellerrClientOffline(unittest.TestCase):
+    """
+    Tests that run without network access by stubbing the HTTP session.
+    """
+    def setUp(self):
+        self.client = LabellerrClient('api_key', 'api_secret')
+        # exact poll waits are asserted below; jitter is covered by its own test
+        jitter = mock.patch.object(client_module, 'POLL_JITTER', 0)
+        jitter.start()
+        self.addCleanup(jitter.stop)
+
+    def _response(self, status_code=200, body=None):
+        response = mock.Mock()
+        response.status_code = status_code
+        response.json.return_value = body if body is not None else {}
+        response.text = json.dumps(body if body is not None else {})
+        response.content = response.text.encode()
+        response.headers = {}
+        return response
+
+    def test_requests_reuse_client_session(self):
+        self.client._session = mock.Mock()
+        self.client._session.request.return_value = self._response(body={'linked': [], 'unlinked': []})
+
+        self.client.get_all_dataset('1', 'image', 'project_1', 'project')
+        self.client.get_all_dataset('1', 'image', 'project_1', 'client')
+
+        self.assertEqual(self.client._session.request.call_count, 2)
+
+    def test_json_helpers_round_trip(self):
+        body = {'project_id': 'p1', 'rotation': {'annotation_rotation_count': 1}, 'isGoldDataset': False}
+        self.assertEqual(client_module._json_loads(client_module._json_dumps(body)), body)
+
+    def test_batches_packed_first_fit_decreasing(self):
+        mb = 1024 * 1024
+        files = [('a', 14 * mb), ('b', 2 * mb), ('c', 1 * mb), ('d', 13 * mb), ('huge', 20 * mb)]
+
+        batches = client_module._pack_batches(files, max_size=15 * mb, max_count=900)
+
+        self.assertEqual(batches, [['huge'], ['a', 'c'], ['d', 'b']])
+
+    def test_batches_respect_file_count(self):
+        batches = client_module._pack_batches([(str(i), 1) for i in range(5)], max_size=100, max_count=2)
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+
+    def test_cache_buster_unique_per_call(self):
+        values = {client_module._cache_buster() for _ in range(100)}
+        self.assertEqual(len(values), 100)
+
+    def test_preannotation_upload_and_status_use_client_session(self):
+        with tempfile.TemporaryDirectory() as folder:
+            annotation_file = os.path.join(folder, 'coco.json')
+            with open(annotation_file, 'wb') as f:
+                f.write(b'{"images": []}')
+            self.client._session = mock.Mock()
+            self.client._session.request.side_effect = [
+                self._response(body={'response': {'job_id': 'j1'}}),
+                self._response(body={'response': {'status': 'completed'}})
+            ]
+
+            result = self.client.upload_preannotation_by_project_id('p1', '1', 'coco_json', annotation_file)
+
+            self.assertEqual(result, {'response': {'status': 'completed'}})
+            self.assertEqual([c[0][0] for c in self.client._session.request.call_args_list], ['POST', 'GET'])
+
+    def test_preannotation_file_streamed_as_multipart(self):
+        with tempfile.TemporaryDirectory() as folder:
+            annotation_file = os.path.join(folder, 'coco.json')
+            with open(annotation_file, 'wb') as f:
+                f.write(b'{"images": []}')
+            sent = {}
+
+            def request(method, url, headers=None, data=None):
+                if method == 'POST':
+                    sent.update(body=data, content_type=headers['Content-Type'], length=len(data), content=data.read())
+                    return self._response(body={'response': {'job_id': 'j1'}})
+                return self._response(body={'response': {'status': 'completed'}})
+
+            self.client._session = mock.Mock()
+            self.client._session.request.side_effect = request
+            self.client.upload_preannotation_by_project_id('p1', '1', 'coco_json', annotation_file)
+
+        self.assertIsInstance(sent['body'], client_module.MultipartStream)
+        self.assertEqual(sent['content_type'], sent['body'].content_type)
+        self.assertEqual(sent['length'], len(sent['content']))
+        self.assertIn(b'{"images": []}', sent['content'])
+
+    def test_preannotation_rejected_upload_not_polled(self):
+        with tempfile.TemporaryDirectory() as folder:
+            annotation_file = os.path.join(folder, 'coco.json')
+            with open(annotation_file, 'wb') as f:
+                f.write(b'{"images": []}')
+            self.client._session = mock.Mock()
+            self.client._session.request.return_value = self._response(status_code=400, body={'error': 'bad format'})
+
+            future = self.client.upload_preannotation_by_project_id_async('p1', '1', 'coco_json', annotation_file)
+            with self.assertRaisesRegex(LabellerrError, 'bad format'):
+                future.result(5)
+
+        self.assertEqual(self.client._session.request.call_count, 1)
+
+    def test_preannotation_rejects_directory(self):
+        self.client._session = mock.Mock()
+        with tempfile.TemporaryDirectory() as folder:
+            with self.assertRaises(LabellerrError):
+                self.client.upload_preannotation_by_project_id('p1', '1', 'coco_json', folder)
+        self.client._session.request.assert_not_called()
+
+    def test_job_status_polled_with_backoff(self):
+        pending = self._response(body={'response': {'status': 'in_progress'}})
+        self.client._session = mock.Mock()
+        self.client._session.request.side_effect = [pending, pending, pending, self._response(body={'response': {'status': 'completed'}})]
+
+        with mock.patch.object(client_module.time, 'sleep') as sleep:
+            result = self.client._poll_until_complete('p1', 'j1', '1')
+
+        self.assertEqual(result['response']['status'], 'completed')
+        self.assertEqual([c[0][0] for c in sleep.call_args_list], [0.5, 0.75, 1.125])
+
+    def test_job_status_revalidated_with_etag(self):
+        pending = self._response(body={'response': {'status': 'in_progress'}})
+        pending.headers = {'ETag': '"v1"', 'Cache-Control': 'private, max-age=4'}
+        not_modified = self._response(status_code=304)
+        not_modified.content = b''
+        not_modified.headers = pending.headers
+        self.client._session = mock.Mock()
+        self.client._session.request.side_effect = [pending, not_modified, self._response(body={'response': {'status': 'completed'}})]
+
+        with mock.patch.object(client_module.time, 'sleep') as sleep:
+            result = self.client._poll_until_complete('p1', 'j1', '1')
+
+        self.assertEqual(result['response']['status'], 'completed')
+        sent = [c[1]['headers'].get('If-None-Match') for c in self.client._session.request.call_args_list]
+        self.assertEqual(sent, [None, '"v1"', '"v1"'])
+        # the server's max-age outlasts the first backoff steps
+        self.assertEqual([c[0][0] for c in sleep.call_args_list], [4, 4])
+        self.assertEqual(self.client._job_status_etags, {})
+
+    def test_job_status_waits_for_retry_after_with_jitter(self):
+        busy = self._response(status_code=503)
+        busy.text = '<html><body>503 Service Temporarily Unavailable</body></html>'
+        busy.content = busy.text.encode()
+        # longer than POLL_MAX_DELAY, which caps only the backoff and max-age
+        busy.headers = {'Retry-After': '45'}
+        self.client._session = mock.Mock()
+        self.client._session.request.side_effect = [busy, self._response(body={'response': {'status': 'completed'}})]
+
+        with mock.patch.object(client_module, 'POLL_JITTER', 0.25), \
+                mock.patch.object(client_module.random, 'uniform', return_value=0.1) as uniform, \
+                mock.patch.object(client_module.time, 'sleep') as sleep:
+            self.client._poll_until_complete('p1', 'j1', '1')
+
+        uniform.assert_called_once_with(0, 0.25)
+        self.assertAlmostEqual(sleep.call_args[0][0], 45.1)
+        self.assertEqual(client_module._retry_after({'Retry-After': 'Thu, 01 Jan 1970 00:00:00 GMT'}), 0)
+
+    def test_failed_job_stops_polling_and_is_remembered(self):
+        self.client._session = mock.Mock()
+        self.client._session.request.side_effect = [
+            self._response(body={'response': {'status': 'in_progress'}}),
+            self._response(body={'response': {'status': 'failed', 'message': 'bad annotation file'}}),
+        ]
+
+        with mock.patch.object(client_module.time, 'sleep') as sleep:
+            for _ in range(2):
+                with self.assertRaisesRegex(LabellerrError, 'j1 failed: bad annotation file'):
+                    self.client._poll_until_complete('p1', 'j1', '1')
+
+        self.assertEqual(sleep.call_count, 1)
+        self.assertEqual(self.client._session.request.call_count, 2)
+
+    def test_max_age_from_cache_headers(self):
+        self.assertEqual(client_module._max_age({'Cache-Control': 'no-cache'}), 0)
+        self.assertEqual(client_module._max_age({'Cache-Control': 'public, max-age=7'}), 7)
+        self.assertEqual(client_module._max_age({'Expires': 'Thu, 01 Jan 1970 00:00:00 GMT'}), 0)
+        self.assertEqual(client_module._max_age({'Expires': 'garbage'}), 0)
+
+    def test_malformed_job_status_raises(self):
+        self.client._session = mock.Mock()
+        self.client._session.request.return_value = self._response(status_code=502, body={'error': 'bad gateway'})
+
+        with mock.patch.object(client_module.time, 'sleep') as sleep:
+            with self.assertRaises(LabellerrError):
+                self.client._poll_until_complete('p1', 'j1', '1')
+        sleep.assert_not_called()
+
+    def test_job_polling_stops_at_deadline(self):
+        client = LabellerrClient('api_key', 'api_secret', max_poll_wait=2)
+        client._session = mock.Mock()
+        client._session.request.return_value = self._response(body={'response': {'status': 'in_progress'}})
+        clock = [0.0]
+
+        def sleep(seconds):
+            clock[0] += seconds
+
+        with mock.patch.object(client_module.time, 'monotonic', lambda: clock[0]), \
+                mock.patch.object(client_module.time, 'sleep', side_effect=sleep) as sleeper:
+            with self.assertRaisesRegex(LabellerrError, 'did not complete'):
+                client._poll_until_complete('p1', 'j1', '1')
+
+        # 0.5 + 0.75, then only the 0.75 s left before the deadline
+        self.assertEqual([c[0][0] for c in sleeper.call_args_list], [0.5, 0.75, 0.75])
+        self.assertEqual(client._session.request.call_count, 4)
+
+    def test_completed_job_status_not_fetched_again(self):
+        self.client._session = mock.Mock()
+        self.client._session.request.return_value = self._response(body={'response': {'status': 'completed'}})
+
+        first = self.client._poll_until_complete('p1', 'j1', '1')
+        second = self.client._poll_until_complete('p1', 'j1', '1')
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.client._session.request.call_count, 1)
+
+    def test_async_job_status_returns_before_job_completes(self):
+        release = threading.Event()
+        self.client.project_id, self.client.job_id, self.client.client_id = 'p1', 'j1', '1'
+        self.client._poll_until_complete = lambda *args: release.wait(5) and {'response': {'status': 'completed'}}
+
+        first = self.client.preannotation_job_status_async()
+        second = self.client.preannotation_job_status_async()
+        self.assertFalse(first.done())
+        release.set()
+
+        self.assertEqual(first.result(5), second.result(5))
+        self.assertEqual(len(self.client._executor._threads), 2)
+
+    def test_several_jobs_polled_in_one_loop(self):
+        statuses = {'j1': ['completed'], 'j2': ['in_progress', 'in_progress', 'completed']}
+
+        def request(method, url, headers=None):
+            job_id = url.split('job_id=')[1].split('&')[0]
+            return self._response(body={'response': {'status': statuses[job_id].pop(0), 'job_id': job_id}})
+
+        self.client._session = mock.Mock()
+        self.client._session.request.side_effect = request
+        with mock.patch.object(client_module.time, 'sleep') as sleep:
+            results = self.client.preannotation_jobs_status_async([('p1', 'j1', '1'), ('p1', 'j2', '1'), ('p1', 'j1', '1')])
+            done = [future.result(5) for future in results]
+
+        self.assertEqual([d['response']['job_id'] for d in done], ['j1', 'j2', 'j1'])
+        self.assertEqual(self.client._session.request.call_count, 4)
+        self.assertEqual([c[0][0] for c in sleep.call_args_list], [0.5, 0.75])
+
+    def test_several_jobs_wait_for_longest_retry_after(self):
+        statuses = {'j1': ['busy', 'completed'], 'j2': ['in_progress', 'completed']}
+
+        def request(method, url, headers=None):
+            job_id = url.split('job_id=')[1].split('&')[0]
+            status = statuses[job_id].pop(0)
+            if status == 'busy':
+                response = self._response(status_code=429, body={'error': 'too many requests'})
+                response.headers = {'Retry-After': '20'}
+                return response
+            return self._response(body={'response': {'status': status, 'job_id': job_id}})
+
+        self.client._session = mock.Mock()
+        self.client._session.request.side_effect = request
+        with mock.patch.object(client_module.time, 'sleep') as sleep:
+            results = self.client.preannotation_jobs_status_async([('p1', 'j1', '1'), ('p1', 'j2', '1')])
+            done = [future.result(5) for future in results]
+
+        self.assertEqual([d['response']['job_id'] for d in done], ['j1', 'j2'])
+        # j2's zero max-age does not shorten the wait the rate-limited server asked for
+        self.assertEqual([c[0][0] for c in sleep.call_args_list], [20])
+
+    def test_several_jobs_fail_when_poll_loop_breaks(self):
+        self.client._session = mock.Mock()
+        # the status checks can no longer be scheduled, as after close()
+        self.client._io_pool.shutdown(wait=True)
+
+        results = self.client.preannotation_jobs_status_async([('p1', 'j1', '1'), ('p1', 'j2', '1')])
+
+        for future in results:
+            with self.assertRaises(RuntimeError):
+                future.result(5)
+        self.client._session.request.assert_not_called()
+
+    def test_create_project_validates_upload_source_before_any_call(self):
+        payload = {
+            'client_id': '1', 'dataset_name': 'd', 'dataset_description': 'd', 'data_type': 'image',
+            'created_by': 'a@b.c', 'project_name': 'p', 'annotation_guide': [], 'autolabel': False
+        }
+        self.client.create_dataset = mock.Mock()
+        for source in ({}, {'files_to_upload': []}, {'folder_to_upload': ' '}, {'files_to_upload': ['a.jpg'], 'folder_to_upload': 'f'}):
+            with self.assertRaises(LabellerrError):
+                self.client.initiate_create_project({**payload, **source})
+        self.client.create_dataset.assert_not_called()
+
+    def test_create_project_sets_up_project_while_files_upload(self):
+        payload = {
+            'client_id': '1', 'dataset_name': 'd', 'dataset_description': 'd', 'data_type': 'image',
+            'created_by': 'a@b.c', 'project_name': 'p', 'annotation_guide': [], 'autolabel': False,
+            'files_to_upload': ['a.jpg']
+        }
+        project_created = threading.Event()
+        self.client.create_dataset = mock.Mock(return_value={'dataset_id': 'd1'})
+        self.client.create_empty_project = mock.Mock(
+            side_effect=lambda *args: project_created.set() or {'project_id': 'p1', 'project_config': {}}
+        )
+        self.client.update_project_annotation_guideline = mock.Mock(return_value={'ok': True})
+        # the upload only finishes once the project exists, which never happens if the steps run in turn
+        self.client._upload_to_dataset = mock.Mock(side_effect=lambda config, files: {'uploaded': project_created.wait(5)})
+        self.client.link_dataset_to_project = mock.Mock(return_value={'linked': True})
+
+        with tempfile.TemporaryDirectory() as folder:
+            payload['files_to_upload'] = [os.path.join(folder, 'a.jpg')]
+            open(payload['files_to_upload'][0], 'wb').close()
+            result = self.client.initiate_create_project(payload)
+
+        self.assertEqual(result['dataset_files'], {'uploaded': True})
+        self.assertEqual((result['project_id'], result['annotation_guide']), ('p1', {'ok': True}))
+        self.client.link_dataset_to_project.assert_called_once_with('1', 'p1', 'd1')
+
+    def test_create_project_not_started_for_folder_over_limit(self):
+        self.client.create_dataset = mock.Mock(return_value={'dataset_id': 'd1'})
+        self.client.create_empty_project = mock.Mock()
+        self.client.commence_files_upload = mock.Mock()
+        with tempfile.TemporaryDirectory() as folder:
+            for name in ('a.jpg', 'b.jpg'):
+                open(os.path.join(folder, name), 'wb').close()
+            payload = {
+                'client_id': '1', 'dataset_name': 'd', 'dataset_description': 'd', 'data_type': 'image',
+                'created_by': 'a@b.c', 'project_name': 'p', 'annotation_guide': [], 'autolabel': False,
+                'folder_to_upload': folder
+            }
+            with mock.patch.object(client_module, 'TOTAL_FILES_COUNT_LIMIT_PER_DATASET', 1), \
+                    self.assertRaisesRegex(LabellerrError, 'Failed to upload files'):
+                self.client.initiate_create_project(payload)
+
+        self.client.create_empty_project.assert_not_called()
+        self.client.commence_files_upload.assert_not_called()
+
+    def test_upload_folder_content_rejects_missing_or_empty_folder(self):
+        self.client.upload_folder_files_to_dataset = mock.Mock(return_value={'success': []})
+        with tempfile.TemporaryDirectory() as folder:
+            for path in (os.path.join(folder, 'missing'), folder):
+                with self.assertRaises(LabellerrError):
+                    self.client.upload_folder_content('1', 'd1', 'image', path)
+            open(os.path.join(folder, 'a.jpg'), 'wb').close()
+            self.client.upload_folder_content('1', 'd1', 'image', folder)
+        self.client.upload_folder_files_to_dataset.assert_called_once()
+
+    def test_create_dataset_raises_labellerr_error(self):
+        config = {'client_id': '1', 'dataset_name': 'd', 'dataset_description': 'd', 'created_by': 'a@b.c'}
+        self.client._session = mock.Mock()
+        self.client._session.request.return_value = self._response(status_code=500, body={})
+
+        with self.assertRaisesRegex(LabellerrError, 'Invalid data_type'):
+            self.client.create_dataset({**config, 'data_type': 'hologram'})
+        with self.assertRaisesRegex(LabellerrError, 'request track id'):
+            self.client.create_dataset({**config, 'data_type': 'image'})
+
+    def test_create_empty_project_passes_rotation_config_along(self):
+        self.client._session = mock.Mock()
+        self.client._session.request.return_value = self._response(body={})
+        config = {'annotation_rotation_count': 0, 'review_rotation_count': 1, 'client_review_rotation_count': 0}
+
+        result = self.client.create_empty_project('1', 'p', 'image', config)
+
+        url = self.client._session.request.call_args_list[-1][0][1]
+        self.assertIn(f"project_id={result['project_id']}", url)
+        self.assertEqual(json.loads(self.client._session.request.call_args_list[-1][1]['data']), config)
+        self.assertFalse(hasattr(self.client, 'rotation_config'))
+
+    def test_rate_limited_reads_retried_uploads_not(self):
+        retry = self.client._session.get_adapter('https://example.com').max_retries
+        self.assertTrue(retry.is_retry('GET', 429, has_retry_after=True))
+        self.assertTrue(retry.respect_retry_after_header)
+        self.assertFalse(retry.is_retry('POST', 429))
+
+    def test_credentials_set_once_on_session(self):
+        headers = self.client._session.headers
+        self.assertEqual((headers['api_key'], headers['api_secret'], headers['source']), ('api_key', 'api_secret', 'sdk'))
+        self.assertEqual((headers['Content-Type'], headers['Origin']), ('application/json', 'https://dev.labellerr.com'))
+
+    def test_upload_concurrency_independent_of_cpu_count(self):
+        client = LabellerrClient('api_key', 'api_secret', max_upload_concurrency=3)
+        client._process_batch = mock.Mock(return_value={'success': True})
+        seen = []
+        real_executor = client_module.ThreadPoolExecutor
+
+        def executor(max_workers):
+            seen.append(max_workers)
+            return real_executor(max_workers=max_workers)
+
+        with mock.patch.object(client_module, 'ThreadPoolExecutor', side_effect=executor):
+            client._upload_to_dataset(
+                {'client_id': '1', 'dataset_id': 'd1', 'data_type': 'image'},
+                [(str(i), client_module.FILE_BATCH_SIZE) for i in range(5)]
+            )
+
+        self.assertEqual(seen, [3])
+        with self.assertRaises(LabellerrError):
+            LabellerrClient('api_key', 'api_secret', max_upload_concurrency=0)
+
+    def test_per_file_upload_mode_sends_one_request_per_file(self):
+        self.client._process_batch = mock.Mock(return_value={'success': True})
+        files = [(name, 10) for name in ('a.jpg', 'b.jpg', 'c.jpg')]
+
+        result = self.client._upload_to_dataset(
+            {'client_id': '1', 'dataset_id': 'd1', 'data_type': 'image', 'upload_mode': 'per_file'}, files
+        )
+
+        self.assertEqual(sorted(c[0][1] for c in self.client._process_batch.call_args_list), [['a.jpg'], ['b.jpg'], ['c.jpg']])
+        self.assertEqual(sorted(result['success']), ['a.jpg', 'b.jpg', 'c.jpg'])
+        with self.assertRaises(LabellerrError):
+            self.client._upload_to_dataset({'client_id': '1', 'dataset_id': 'd1', 'data_type': 'image', 'upload_mode': 'x'}, files)
+
+    def test_session_accepts_compressed_responses(self):
+        self.assertIn('gzip', self.client._session.headers['Accept-Encoding'])
+
+    def test_connection_pool_covers_upload_workers(self):
+        adapter = self.client._session.get_adapter('https://')
+        self.assertGreaterEqual(adapter._pool_maxsize, client_module.UPLOAD_MAX_WORKERS)
+
+    def test_iter_all_dataset_yields_every_scope(self):
+        self.client.get_all_dataset = mock.Mock(side_effect=lambda client_id, datatype, project_id, scope: {
+            'linked': [{'dataset_id': f'{scope}-linked'}],
+            'unlinked': [{'dataset_id': f'{scope}-unlinked'}]
+        })
+
+        result = list(self.client.iter_all_dataset('1', 'image', 'p1', scopes=['project', 'client']))
+
+        self.assertEqual([(scope, dataset['dataset_id']) for scope, dataset in result], [
+            ('project', 'project-linked'), ('project', 'project-unlinked'),
+            ('client', 'client-linked'), ('client', 'client-unlinked')
+        ])
+
+    def test_concurrent_identical_reads_share_one_request(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_request(*args, **kwargs):
+            started.set()
+            release.wait(5)
+            return self._response(body={'response': []})
+
+        self.client._session = mock.Mock()
+        self.client._session.request.side_effect = slow_request
+        results = []
+        first = threading.Thread(target=lambda: results.append(self.client.get_all_project_per_client_id('1')))
+        second = threading.Thread(target=lambda: results.append(self.client.get_all_project_per_client_id('1')))
+
+        first.start()
+        started.wait(5)
+        second.start()
+        time.sleep(0.1)
+        release.set()
+        first.join(5)
+        second.join(5)
+
+        self.assertEqual(results, [{'response': []}, {'response': []}])
+        self.assertEqual(self.client._session.request.call_count, 1)
+
+    def test_uncached_read_does_not_join_request_in_flight(self):
+        started = threading.Event()
+        release = threading.Event()
+        replies = iter([{'response': ['old']}, {'response': ['new']}])
+
+        def request(*args, **kwargs):
+            body = next(replies)
+            if body == {'response': ['old']}:
+                started.set()
+                release.wait(5)
+            return self._response(body=body)
+
+        self.client._session = mock.Mock()
+        self.client._session.request.side_effect = request
+        first = threading.Thread(target=lambda: self.client.get_all_project_per_client_id('1'))
+
+        first.start()
+        started.wait(5)
+        fresh = self.client.get_all_project_per_client_id('1', use_cache=False)
+        release.set()
+        first.join(5)
+
+        self.assertEqual(fresh, {'response': ['new']})
+        self.assertEqual(self.client._session.request.call_count, 2)
+
+    def test_prefetched_project_datasets_served_from_cache(self):
+        self.client._session = mock.Mock()
+        self.client._session.request.return_value = self._response(body={'linked': [], 'unlinked': []})
+        projects = [{'project_id': 'p1', 'data_type': 'image'}, {'project_id': 'p2', 'data_type': 'video'}]
+
+        futures = self.client.prefetch_project_datasets('1', projects)
+        for future in futures:
+            future.result(5)
+        self.client.get_all_dataset('1', 'image', 'p1', 'project')
+        self.client.get_all_dataset('1', 'video', 'p2', 'project')
+
+        self.assertEqual(self.client._session.request.call_count, 2)
+
+    def test_mutating_cached_result_leaves_cache_intact(self):
+        self.client._session = mock.Mock()
+        self.client._session.request.return_value = self._response(body={'linked': [{'id': 'd1'}], 'unlinked': []})
+
+        first = self.client.get_all_dataset('1', 'image', 'p1', 'project')
+        first['linked'].clear()
+        second = self.client.get_all_dataset('1', 'image', 'p1', 'project')
+        second['unlinked'].append({'id': 'd2'})
+
+        self.assertEqual(self.client.get_all_dataset('1', 'image', 'p1', 'project'), {'linked': [{'id': 'd1'}], 'unlinked': []})
+        self.assertEqual(self.client._session.request.call_count, 1)
+
+    def test_dataset_listing_refetched_after_create_or_link(self):
+        self.client._session = mock.Mock()
+        self.client._session.request.return_value = self._response(body={'linked': [], 'unlinked': []})
+        writes = (
+            lambda: self.client.create_dataset({
+                'client_id': '1', 'dataset_name': 'd', 'dataset_description': 'd', 'data_type': 'image', 'created_by': 'a@b.c'
+            }),
+            lambda: self.client.link_dataset_to_project('1', 'p1', 'd1'),
+        )
+        for write in writes:
+            self.client.get_all_dataset('1', 'image', 'p1', 'project')
+            write()
+            self.client._session.request.reset_mock()
+            self.client.get_all_dataset('1', 'image', 'p1', 'project')
+            self.assertEqual(self.client._session.request.call_count, 1)
+
+    def test_dataset_refetched_after_upload_or_link(self):
+        self.client._session = mock.Mock()
+        self.client._session.request.return_value = self._response(body={'files_count': 0})
+        self.client._process_batch = mock.Mock(return_value={'success': True})
+        writes = (
+            lambda: self.client._upload_to_dataset({'client_id': '1', 'dataset_id': 'd1', 'data_type': 'image'}, [('a.jpg', 1)]),
+            lambda: self.client.link_dataset_to_project('1', 'p1', 'd1'),
+        )
+        for write in writes:
+            self.client.get_dataset('1', 'd1', 'p1')
+            write()
+            self.client._session.request.reset_mock()
+            self.client.get_dataset('1', 'd1', 'p1')
+            self.assertEqual(self.client._session.request.call_count, 1)
+
+    def test_project_list_refetched_after_project_writes(self):
+        self.client._session = mock.Mock()
+        self.client._session.request.return_value = self._response(body={'response': []})
+        self.client.update_rotation_count = mock.Mock(return_value={})
+        writes = (
+            lambda: self.client.create_empty_project('1', 'p', 'image'),
+            lambda: self.client.link_dataset_to_project('1', 'p1', 'd1'),
+        )
+        for write in writes:
+            self.client.get_all_project_per_client_id('1')
+            write()
+            self.client._session.request.reset_mock()
+            self.client.get_all_project_per_client_id('1')
+            self.assertEqual(self.client._session.request.call_count, 1)
+
+    def test_context_manager_closes_session_once(self):
+        with mock.patch('labellerr.client.requests.Session') as Session:
+            with LabellerrClient('api_key', 'api_secret') as client:
+                pass
+            client.close()
+
+        Session.return_value.close.assert_called_once_with()
+
+    def test_from_env_reads_credentials(self):
+        with mock.patch.dict(os.environ, {'LABELLERR_API_KEY': 'key', 'LABELLERR_API_SECRET': 'secret'}):
+            client = LabellerrClient.from_env()
+        self.assertEqual((client.api_key, client.api_secret), ('key', 'secret'))
+
+        with mock.patch.dict(os.environ, {}, clear=True):
+            with self.assertRaises(LabellerrError):
+                LabellerrClient.from_env()
+
+    def test_get_dataset_memoized_until_cache_cleared(self):
+        self.client._session = mock.Mock()
+        self.client._session.request.return_value = self._response(body={'dataset_id': 'd1'})
+
+        self.client.get_dataset('1', 'd1', 'p1')
+        self.client.get_dataset('1', 'd1', 'p1')
+        self.assertEqual(self.client._session.request.call_count, 1)
+
+        self.client.clear_cache()
+        self.client.get_dataset('1', 'd1', 'p1')
+        self.assertEqual(self.client._session.request.call_count, 2)
+
+    def test_project_list_cached_unless_use_cache_false(self):
+        self.client._session = mock.Mock()
+        self.client._session.request.return_value = self._response(body={'response': []})
+
+        self.client.get_all_project_per_client_id('1')
+        self.client.get_all_project_per_client_id('1')
+        self.assertEqual(self.client._session.request.call_count, 1)
+
+        self.client.get_all_project_per_client_id('1', use_cache=False)
+        self.assertEqual(self.client._session.request.call_count, 2)
+
+    def test_get_datasets_fetches_each_id_once(self):
+        self.client._session = mock.Mock()
+        self.client._session.request.side_effect = lambda method, url, headers: self._response(body={'url': url})
+
+        result = self.client.get_datasets('1', ['d1', 'd2', 'd1'], 'p1')
+
+        self.assertEqual(list(result), ['d1', 'd2'])
+        self.assertEqual(self.client._session.request.call_count, 2)
+        self.assertIn('dataset_id=d2', result['d2']['url'])
+
+    def test_query_values_percent_encoded(self):
+        self.client._session = mock.Mock()
+        self.client._session.request.side_effect = lambda method, url, headers: self._response(body={'url': url})
+
+        result = self.client.get_dataset('1', 'd 1&x=2', 'p1')
+
+        self.assertIn('dataset_id=d+1%26x%3D2&project_id=p1', result['url'])
+
+    def test_link_and_guideline_calls_do_not_print(self):
+        self.client._session = mock.Mock()
+        self.client._session.request.return_value = self._response(body={'response': 'success'})
+        stdout = io.StringIO()
+
+        with contextlib.redirect_stdout(stdout):
+            self.client.link_dataset_to_project('1', 'p1', 'd1')
+            self.client.update_project_annotation_guideline({
+                'project_id': 'p1', 'client_id': '1', 'autolabel': False, 'data_type': 'image', 'annotation_guideline': []
+            })
+
+        self.assertEqual(stdout.getvalue(), '')
+
+    def test_bulk_lookups_share_the_client_pool(self):
+        self.client._session = mock.Mock()
+        self.client._session.request.side_effect = lambda method, url, headers: self._response(body={'linked': [], 'unlinked': []})
+
+        with mock.patch.object(client_module, 'ThreadPoolExecutor') as executor:
+            self.client.get_datasets('1', ['d1', 'd2'], 'p1')
+            futures = self.client.prefetch_project_datasets('1', [{'project_id': 'p1', 'data_type': 'image'}])
+            futures[0].result(5)
+
+        executor.assert_not_called()
+        self.assertLessEqual(len(self.client._io_pool._threads), client_module.BULK_FETCH_MAX_WORKERS)
+
+    def test_upload_files_to_dataset_uploads_matching_files(self):
+        with tempfile.TemporaryDirectory() as folder:
+            paths = []
+            for name in ('a.jpg', 'b.png', 'notes.txt'):
+                path = os.path.join(folder, name)
+                with open(path, 'wb') as f:
+                    f.write(b'0' * 10)
+                paths.append(path)
+            self.client.commence_files_upload = mock.Mock(return_value=True)
+
+            result = self.client.upload_files_to_dataset({
+                'client_id': '1',
+                'dataset_id': 'd1',
+                'data_type': 'image',
+                'files_list': paths
+            })
+
+            self.assertEqual(sorted(result['success']), sorted(paths[:2]))
+            self.assertEqual(result['fail'], [])
+
+    def test_batch_upload_streams_open_files(self):
+        with tempfile.TemporaryDirectory() as folder:
+            paths = []
+            for name, content in (('a.jpg', b'first'), ('b.png', b'second')):
+                path = os.path.join(folder, name)
+                with open(path, 'wb') as f:
+                    f.write(content)
+                paths.append(path)
+            sent = {}
+
+            def post(url, headers, data):
+                sent['content_type'] = headers['Content-Type']
+                sent['length'] = len(data)
+                sent['body'] = data.read()
+                sent['files'] = [segment for segment in data._segments if hasattr(segment, 'read')]
+                return self._response()
+
+            self.client._session = mock.Mock()
+            self.client._session.post.side_effect = post
+
+            result = self.client._process_batch({'client_id': '1', 'url': 'https://example.com/upload'}, paths)
+
+            self.assertTrue(result['success'])
+            self.assertTrue(all(file_obj.closed for file_obj in sent['files']))
+            self.assertTrue(sent['content_type'].startswith('multipart/form-data; boundary='))
+            self.assertEqual(sent['length'], len(sent['body']))
+            self.assertIn(b'first', sent['body'])
+            self.assertIn(b'second', sent['body'])
+
+    def test_batch_reuses_scanned_sizes(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'a.jpg')
+            with open(path, 'wb') as f:
+                f.write(b'first')
+            self.client._session = mock.Mock()
+            self.client._session.post.side_effect = lambda url, headers, data: (data.read(), self._response())[1]
+
+            with mock.patch('labellerr.multipart.os.path.getsize', side_effect=AssertionError('stat again')):
+                result = self.client._process_batch({'client_id': '1', 'url': 'https://example.com/upload'}, [path], {path: 5})
+
+            self.assertTrue(result['success'])
+
+    def test_file_list_sizes_skip_missing_and_keep_order(self):
+        with tempfile.TemporaryDirectory() as folder:
+            paths = []
+            for name, size in (('a.jpg', 3), ('b.png', 5), ('c.txt', 7)):
+                path = os.path.join(folder, name)
+                with open(path, 'wb') as f:
+                    f.write(b'0' * size)
+                paths.append(path)
+            missing = os.path.join(folder, 'missing.jpg')
+
+            count, size, files = self.client.get_total_file_count_and_total_size([paths[1], missing, None, paths[0], paths[2]], 'image')
+
+            self.assertEqual((count, size, files), (2, 8, [paths[1], paths[0]]))
+
+    def test_folder_scan_stops_at_count_limit(self):
+        with tempfile.TemporaryDirectory() as folder:
+            for directory in ('one', 'two'):
+                os.makedirs(os.path.join(folder, directory))
+                for index in range(3):
+                    with open(os.path.join(folder, directory, f'{index}.jpg'), 'wb') as f:
+                        f.write(b'0')
+
+            with self.assertRaises(LabellerrError):
+                self.client.get_total_folder_file_count_and_total_size(folder, 'image', count_limit=4)
+            self.assertEqual(self.client.get_total_folder_file_count_and_total_size(folder, 'image', count_limit=6)[0], 6)
+
+    def test_folder_scan_counts_nested_matching_files(self):
+        with tempfile.TemporaryDirectory() as folder:
+            os.makedirs(os.path.join(folder, 'sub', 'deeper'))
+            os.makedirs(os.path.join(folder, 'other'))
+            for name, size in (('a.jpg', 3), ('sub/b.png', 5), ('sub/deeper/c.jpeg', 7), ('sub/skip.txt', 11), ('other/d.png', 1)):
+                with open(os.path.join(folder, name), 'wb') as f:
+                    f.write(b'0' * size)
+
+            count, size, files = self.client.get_total_folder_file_count_and_total_size(folder, 'image')
+
+            self.assertEqual((count, size), (4, 16))
+            self.assertEqual(sorted(os.path.relpath(path, folder) for path in files), sorted([
+                'a.jpg', os.path.join('sub', 'b.png'), os.path.join('sub', 'deeper', 'c.jpeg'), os.path.join('other', 'd.png')
+            ]))
+
+    def test_extensions_matched_case_insensitively(self):
+        with tempfile.TemporaryDirectory() as folder:
+            for name in ('a.JPG', 'b.Png', 'c.txt'):
+                with open(os.path.join(folder, name), 'wb') as f:
+                    f.write(b'0')
+
+            count, _, files = self.client.get_total_folder_file_count_and_total_size(folder, 'image')
+            self.assertEqual(count, 2)
+            self.assertEqual(self.client.get_total_file_count_and_total_size(files, 'image')[0], 2)
+
+    def test_get_dataset_served_from_disk_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client = LabellerrClient('api_key', 'api_secret', cache_dir=cache_dir)
+            client._session = mock.Mock()
+            client._session.request.return_value = self._response(body={'dataset_id': 'd1'})
+
+            first = client.get_dataset('1', 'd1', 'p1')
+
+            # a fresh client on the same directory does not hit the network again
+            other = LabellerrClient('api_key', 'api_secret', cache_dir=cache_dir)
+            other._session = mock.Mock()
+            second = other.get_dataset('1', 'd1', 'p1')
+
+            self.assertEqual(first, second)
+            other._session.request.assert_not_called()
+
+    def test_get_dataset_revalidates_stale_entry_with_etag(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client = LabellerrClient('api_key', 'api_secret', cache_dir=cache_dir)
+            client._disk_cache.ttl = -1
+            fresh = self._response(body={'dataset_id': 'd1'})
+            fresh.headers = {'ETag': '"v1"'}
+            client._session = mock.Mock()
+            client._session.request.side_effect = [fresh, self._response(status_code=304)]
+
+            client.get_dataset('1', 'd1', 'p1')
+            client._memory_cache.clear()
+            result = client.get_dataset('1', 'd1', 'p1')
+
+            self.assertEqual(result, {'dataset_id': 'd1'})
+            self.assertEqual(client._session.request.call_args[1]['headers']['If-None-Match'], '"v1"')
+
+    def test_invalidate_cache_drops_one_method(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client = LabellerrClient('api_key', 'api_secret', cache_dir=cache_dir)
+            client._session = mock.Mock()
+            client._session.request.return_value = self._response(body={'response': []})
+            client.get_dataset('1', 'd1', 'p1')
+            client.get_all_project_per_client_id('1')
+
+            client.invalidate_cache('get_all_project_per_client_id')
+            client.get_dataset('1', 'd1', 'p1')
+            client.get_all_project_per_client_id('1')
+
+            self.assertEqual(client._session.request.call_count, 3)
+
+    def test_disk_cache_dropped_after_sdk_upgrade(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            path = os.path.join(cache_dir, 'cache.sqlite')
+            DiskCache(path, version='1').set(['get_dataset', 'd1'], {'dataset_id': 'd1'})
+
+            self.assertIsNotNone(DiskCache(path, version='1').get(['get_dataset', 'd1']))
+            self.assertIsNone(DiskCache(path, version='2').get(['get_dataset', 'd1']))
+
+    def test_disk_cache_values_readable_with_and_without_orjson(self):
+        value = {'linked': [{'name': 'caf\u00e9', 'files': 3}], 'unlinked': []}
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = DiskCache(os.path.join(cache_dir, 'cache.sqlite'))
+            with mock.patch('labellerr.cache.orjson', None):
+                cache.set(['projects', '1'], value)
+            self.assertEqual(cache.get(['projects', '1'])[0], value)
+
+            cache.set(['projects', '2'], value)
+            with mock.patch('labellerr.cache.orjson', None):
+                self.assertEqual(cache.get(['projects', '2'])[0], value)
+
+
 if __name__ == '__main__':
     unittest.main()
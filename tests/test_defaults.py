@@ -0,0 +1,50 @@
+import unittest
+import os
+from unittest import mock
+import labellerr
+from labellerr import _defaults
+from labellerr.exceptions import LabellerrError
+
+# RUNNING
+# python -m unittest discover -s tests
+
+
+class TestDefaultClient(unittest.TestCase):
+    def tearDown(self):
+        _defaults._CLIENTS.clear()
+
+    def test_client_is_shared_per_credentials(self):
+        with mock.patch.dict(os.environ, {'LABELLERR_API_KEY': 'key', 'LABELLERR_API_SECRET': 'secret'}):
+            first = labellerr.get_default_client()
+            second = labellerr.get_default_client()
+
+        self.assertIs(first, second)
+        self.assertEqual(first.api_key, 'key')
+        self.assertIsNot(first, labellerr.get_default_client('other_key', 'secret'))
+
+    def test_closed_client_replaced(self):
+        first = labellerr.get_default_client('key', 'secret')
+        with first:
+            pass
+
+        second = labellerr.get_default_client('key', 'secret')
+        self.assertIsNot(first, second)
+        self.assertFalse(second.closed)
+        self.assertIs(second, labellerr.get_default_client('key', 'secret'))
+
+    def test_dotenv_loaded_once(self):
+        dotenv = mock.Mock()
+        with mock.patch.dict('sys.modules', {'dotenv': dotenv}), mock.patch.object(_defaults, '_ENV_LOADED', False):
+            _defaults.load_env()
+            _defaults.load_env()
+
+        dotenv.load_dotenv.assert_called_once_with()
+
+    def test_missing_credentials_raise(self):
+        with mock.patch.dict(os.environ, {}, clear=True):
+            with self.assertRaises(LabellerrError):
+                labellerr.get_default_client()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+import io
+import requests
+from labellerr.http2 import Http2Session, httpx
+
+# RUNNING
+# python -m unittest discover -s tests
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestHttp2Session(unittest.TestCase):
+    def setUp(self):
+        self.session = Http2Session(max_connections=4, max_keepalive_connections=2)
+        self.session._client = httpx.Client(transport=httpx.MockTransport(self._handler))
+        self.requests_seen = []
+
+    def tearDown(self):
+        self.session.close()
+
+    def _handler(self, request):
+        self.requests_seen.append(request)
+        return httpx.Response(200, json={'ok': True})
+
+    def test_bytes_body_sent_as_content(self):
+        response = self.session.request('POST', 'https://example.com/x', data=b'{"a":1}', headers={'client_id': '1'})
+
+        self.assertEqual(response.json(), {'ok': True})
+        self.assertEqual(self.requests_seen[0].content, b'{"a":1}')
+        self.assertEqual(self.requests_seen[0].headers['client_id'], '1')
+
+    def test_multipart_files(self):
+        files = [('file', ('a.jpg', io.BytesIO(b'abc'), 'application/octet-stream'))]
+        self.session.post('https://example.com/upload', data={}, files=files)
+
+        self.assertIn(b'filename="a.jpg"', self.requests_seen[0].read())
+
+    def test_transport_errors_become_requests_errors(self):
+        def fail(request):
+            raise httpx.ConnectError("refused")
+        self.session._client = httpx.Client(transport=httpx.MockTransport(fail))
+
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            self.session.get('https://example.com/x')
+
+
+if __name__ == '__main__':
+    unittest.main()
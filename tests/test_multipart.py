@@ -0,0 +1,95 @@
+import unittest
+import io
+import os
+import tempfile
+from urllib3.filepost import encode_multipart_formdata
+from labellerr.multipart import LazyFile, MultipartStream
+
+# RUNNING
+# python -m unittest discover -s tests
+
+
+class TestMultipartStream(unittest.TestCase):
+    def test_matches_in_memory_encoding(self):
+        content = b'{"images": []}' * 1000
+        body = MultipartStream([('file', ('a.json', io.BytesIO(content), 'application/octet-stream'))], chunk_size=1000)
+
+        expected, content_type = encode_multipart_formdata(
+            [('file', ('a.json', content, 'application/octet-stream'))], boundary=body.boundary
+        )
+        streamed = b''.join(body)
+
+        self.assertEqual(streamed, expected)
+        self.assertEqual(len(body), len(expected))
+        self.assertEqual(body.content_type, content_type)
+
+    def test_read_in_small_pieces(self):
+        body = MultipartStream([
+            ('file', ('a.jpg', io.BytesIO(b'aaa'), 'image/jpeg')),
+            ('file', ('b.jpg', io.BytesIO(b'bbbb'), 'image/jpeg'))
+        ])
+        pieces = []
+        while True:
+            piece = body.read(5)
+            if not piece:
+                break
+            self.assertLessEqual(len(piece), 5)
+            pieces.append(piece)
+
+        self.assertEqual(len(b''.join(pieces)), len(body))
+
+    def test_lazy_files_opened_one_at_a_time(self):
+        with tempfile.TemporaryDirectory() as folder:
+            files = []
+            for name, content in (('a.jpg', b'a' * 300), ('b.jpg', b'b' * 500)):
+                path = os.path.join(folder, name)
+                with open(path, 'wb') as f:
+                    f.write(content)
+                files.append(LazyFile(path))
+            body = MultipartStream([('file', (os.path.basename(f.path), f, 'image/jpeg')) for f in files])
+
+            self.assertTrue(all(f._file is None for f in files))
+            pieces = []
+            while True:
+                piece = body.read(64)
+                if not piece:
+                    break
+                self.assertLessEqual(sum(f._file is not None for f in files), 1)
+                pieces.append(piece)
+
+        expected, _ = encode_multipart_formdata(
+            [('file', ('a.jpg', b'a' * 300, 'image/jpeg')), ('file', ('b.jpg', b'b' * 500, 'image/jpeg'))],
+            boundary=body.boundary
+        )
+        self.assertEqual(b''.join(pieces), expected)
+        self.assertEqual(len(body), len(expected))
+        self.assertTrue(all(f.closed for f in files))
+
+    def test_file_names_escaped_like_urllib3(self):
+        name = 'b"q\r\n.jpg'
+        body = MultipartStream([('file', (name, io.BytesIO(b'x'), 'image/jpeg'))])
+
+        expected, _ = encode_multipart_formdata([('file', (name, b'x', 'image/jpeg'))], boundary=body.boundary)
+        self.assertEqual(b''.join(body), expected)
+        self.assertIn(b'filename="b%22q%0D%0A.jpg"', expected)
+
+    def test_lazy_file_stops_at_declared_size(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'a.jpg')
+            with open(path, 'wb') as f:
+                f.write(b'a' * 10)
+            lazy = LazyFile(path)
+            body = MultipartStream([('file', ('a.jpg', lazy, 'image/jpeg'))])
+            # the part header and half of the file
+            first = body.read(len(body._segments[0]) + 5)
+            # the file grows after the Content-Length was computed
+            with open(path, 'ab') as f:
+                f.write(b'b' * 100)
+            sent = first + b''.join(body)
+
+        self.assertEqual(len(sent), len(body))
+        self.assertNotIn(b'b', sent.split(b'\r\n\r\n', 1)[1].split(b'\r\n')[0])
+
+
+if __name__ == '__main__':
+    unittest.main()